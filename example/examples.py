@@ -7,14 +7,14 @@ NuclideQuery 库使用示例
 1. 基础查询：使用 Nuclide 类获取核素数据
 2. 理论数据：查询不同 DFT 泛函的计算结果
 3. 数据比较：对比实验值与理论值
-4. 数据可视化：绘制结合能曲线
+4. 数据统计：按字段汇总最小/最大/平均值
+5. 数据可视化：绘制结合能曲线
 
 运行方式：
     python examples.py
 """
 
 import sys
-import matplotlib.pyplot as plt
 
 # 尝试导入 rich 库以获得更好的终端输出体验
 try:
@@ -114,28 +114,34 @@ def demo_theoretical_data():
 
 def demo_plotting():
     """演示绘图功能"""
-    print_header("3. 数据可视化示例")
+    print_header("4. 数据可视化示例")
     print("正在绘制锡(Sn, Z=50)同位素链的比结合能曲线...")
 
     try:
-        # 获取锡的所有同位素 (Z=50)
+        # 仅绘图时才需要 matplotlib：延迟导入，其他示例不受其导入耗时影响，未安装时也能运行
+        import matplotlib.pyplot as plt
+
+        # 以列的形式读取锡的整条同位素链 (Z=50)，缺失值为 NaN
+        fields = ('bindingEnergyPerNucleon',)
         # 实验数据
-        query_exp = NuclideQuery(source='experiment')
-        sn_exp = query_exp.query_isotopes(50)
+        sn_exp = NuclideQuery(source='experiment').get_isotope_columns(50, fields)
         # 理论数据 (UNEDF1)
-        query_theory = NuclideQuery(source='UNEDF1')
-        sn_theory = query_theory.query_isotopes(50)
+        sn_theory = NuclideQuery(source='UNEDF1').get_isotope_columns(50, fields)
+
+        def mass_and_be_a(cols):
+            """返回 (A 列表, BE/A 列表)，跳过缺失值"""
+            points = [(50 + n, be_a) for n, be_a in zip(cols['N'], cols['bindingEnergyPerNucleon'])
+                      if be_a == be_a]
+            return [a for a, _ in points], [be_a for _, be_a in points]
 
         plt.figure(figsize=(10, 6))
 
-        # 提取并绘制实验数据
-        x_exp = [n.A for n in sn_exp if n.BE_A is not None]
-        y_exp = [n.BE_A for n in sn_exp if n.BE_A is not None]
+        # 绘制实验数据
+        x_exp, y_exp = mass_and_be_a(sn_exp)
         plt.plot(x_exp, y_exp, 'o-', label='Experiment (NNDC)', markersize=4, color='black')
 
-        # 提取并绘制理论数据
-        x_theo = [n.A for n in sn_theory if n.BE_A is not None]
-        y_theo = [n.BE_A for n in sn_theory if n.BE_A is not None]
+        # 绘制理论数据
+        x_theo, y_theo = mass_and_be_a(sn_theory)
         plt.plot(x_theo, y_theo, '--', label='Theory (UNEDF1)', linewidth=2, color='red')
 
         plt.title('Binding Energy per Nucleon: Tin Isotopes (Z=50)')
@@ -151,6 +157,22 @@ def demo_plotting():
         print(f"绘图失败: {e}")
 
 
+def demo_statistics():
+    """演示列式统计"""
+    print_header("3. 数据统计示例")
+
+    query = NuclideQuery(source='experiment')
+    # Z=20-30、N=20-40 范围内的核素；summarize 单次遍历列式存储，缺失值自动跳过
+    nuclides = [(n.Z, n.N) for n in query.iter_range(20, 30, 20, 40)]
+    for field, label in [('bindingEnergyPerNucleon', 'BE/A'), ('twoNeutronSeparationEnergy', 'S2n')]:
+        stats = query.summarize(field, nuclides)
+        if stats is None:
+            continue
+        top = Nuclide(*stats['argmax'])
+        print(f"  {label}: {stats['count']} 个核素, 最小 {stats['min']:.3f} MeV, "
+              f"最大 {stats['max']:.3f} MeV ({top.name}), 平均 {stats['mean']:.3f} MeV")
+
+
 def main():
     if HAS_RICH:
         rprint("[bold green]NuclideQuery 示例程序启动[/bold green]")
@@ -159,6 +181,8 @@ def main():
     print()
     demo_theoretical_data()
     print()
+    demo_statistics()
+    print()
     demo_plotting()
 
 if __name__ == "__main__":
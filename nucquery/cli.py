@@ -4,7 +4,10 @@
 """
 
 import argparse
-from typing import Optional, Tuple, List
+import csv
+import re
+import sys
+from typing import Callable, Dict, Iterable, Optional, Tuple, List
 from .nuclide_data import ELEMENT_SYMBOLS
 from .nuclide import Nuclide
 from .data_source import list_sources
@@ -49,12 +52,50 @@ def print_nuclides_info(printer: NuclideRichPrinter, nuclides: List[Nuclide]) ->
         printer.print_error("未找到任何核素数据")
         return
     
-    printer.print_info(f"找到 {len(nuclides)} 个核素:")
+    # 缓冲全部输出，退出时一次性写入终端，避免逐个核素刷新 stdout
+    with printer.console:
+        printer.print_info(f"找到 {len(nuclides)} 个核素:")
+        
+        for nuc in nuclides:
+            if nuc.data:
+                printer.print_nuclide_info(nuc.data)
+                printer.print_separator()
+
+# 整数输入格式（可带负号）
+_INT_PATTERN = re.compile(r'^-?\d+$')
+
+
+def parse_int(text: str) -> Optional[int]:
+    """
+    解析整数字符串
+    
+    返回:
+        整数值，格式不正确时返回 None（不抛出异常）
+    """
+    text = text.strip()
+    return int(text) if _INT_PATTERN.match(text) else None
+
+
+def read_int(printer: NuclideRichPrinter, prompt: str) -> Optional[int]:
+    """
+    交互式读取一个整数，输入无效时提示并重新读取
     
-    for nuc in nuclides:
-        if nuc.data:
-            printer.print_nuclide_info(nuc.data)
-            printer.print_separator()
+    参数:
+        printer: RichPrinter 对象
+        prompt: 输入提示
+        
+    返回:
+        输入的整数，用户输入 'q' 时返回 None
+    """
+    while True:
+        user_input = input(prompt).strip()
+        if user_input.lower() == 'q':
+            return None
+        value = parse_int(user_input)
+        if value is not None:
+            return value
+        printer.print_error("请输入有效的整数!")
+
 
 def parse_range(range_str: str) -> Tuple[Optional[int], Optional[int]]:
     """
@@ -131,6 +172,194 @@ def parse_nuclide_list(nuclides_str: str) -> List[Tuple[int, int]]:
     return nuclide_list
 
 
+def read_nuclide_file(stream: Iterable[str]) -> Tuple[List[Tuple[int, int]], int]:
+    """
+    从 CSV 文本流批量解析核素列表
+    
+    每行为 "Z,N"（可有多余列，如 -o 导出的 CSV）或逗号分隔的核素符号（如 "ni60,pb208"）；
+    空行与导出 CSV 的表头被忽略，其余无法解析的行或核素符号计入跳过数
+    
+    参数:
+        stream: 文件对象或文本行的可迭代对象
+        
+    返回:
+        ([(Z1, N1), (Z2, N2), ...], 跳过的条目数)
+    """
+    nuclide_list = []
+    append = nuclide_list.append
+    skipped = 0
+    
+    for row in csv.reader(stream):
+        cells = [cell for cell in row if cell.strip()]
+        if not cells or row[:2] == ['Z', 'N']:
+            continue
+        
+        # 尝试解析为 Z,N 格式
+        if len(row) >= 2:
+            Z = parse_int(row[0])
+            N = parse_int(row[1])
+            if Z is not None and N is not None:
+                if Z > 0 and N >= 0:
+                    append((Z, N))
+                else:
+                    skipped += 1
+                continue
+        
+        # 逐个解析为元素符号+质量数格式
+        for cell in cells:
+            Z, N = parse_nuclide_string(cell)
+            if Z is not None and N is not None:
+                append((Z, N))
+            else:
+                skipped += 1
+    
+    return nuclide_list, skipped
+
+
+def _do_isotopes(args, printer: NuclideRichPrinter, query_tool: NuclideQuery) -> Optional[List[Nuclide]]:
+    """同位素查询 (-b isotopes)，参数错误时返回 None"""
+    if not args.input1:
+        printer.print_error("同位素查询需要指定质子数")
+        return None
+    
+    Z = parse_int(args.input1)
+    if Z is None:
+        printer.print_error("请输入有效的质子数")
+        return None
+    
+    N_min = N_max = None
+    
+    # 解析中子数范围
+    if args.n_range:
+        N_min, N_max = parse_range(args.n_range)
+        if N_min is None or N_max is None:
+            printer.print_error("中子数范围格式错误，应为: min-max 或 min,max")
+            return None
+    
+    results = query_tool.query_isotopes(Z, N_min, N_max)
+    element_symbol = ELEMENT_SYMBOLS.get(Z, f"X{Z}")
+    printer.print_info(f"查询元素 {element_symbol} (Z={Z}) 的同位素:")
+    print_nuclides_info(printer, results)
+    return results
+
+
+def _do_isotones(args, printer: NuclideRichPrinter, query_tool: NuclideQuery) -> Optional[List[Nuclide]]:
+    """同中子素查询 (-b isotones)，参数错误时返回 None"""
+    if not args.input1:
+        printer.print_error("同中子素查询需要指定中子数")
+        return None
+    
+    N = parse_int(args.input1)
+    if N is None:
+        printer.print_error("请输入有效的中子数")
+        return None
+    
+    Z_min = Z_max = None
+    
+    # 解析质子数范围
+    if args.z_range:
+        Z_min, Z_max = parse_range(args.z_range)
+        if Z_min is None or Z_max is None:
+            printer.print_error("质子数范围格式错误，应为: min-max 或 min,max")
+            return None
+    
+    results = query_tool.query_isotones(N, Z_min, Z_max)
+    printer.print_info(f"查询中子数 N={N} 的同中子素:")
+    print_nuclides_info(printer, results)
+    return results
+
+
+def _do_list(args, printer: NuclideRichPrinter, query_tool: NuclideQuery) -> Optional[List[Nuclide]]:
+    """核素列表查询 (-b list)，参数错误时返回 None"""
+    if not args.nuclides:
+        printer.print_error("列表查询需要使用 --nuclides 参数指定核素列表")
+        printer.print_info("格式: --nuclides 'Z1,N1;Z2,N2;...' 或 --nuclides 'fe56,ni60,pb208'")
+        return None
+    
+    if args.nuclides.startswith('@'):
+        # 从文件（@- 表示标准输入）批量读取
+        path = args.nuclides[1:]
+        try:
+            if path == '-':
+                nuclide_list, skipped = read_nuclide_file(sys.stdin)
+            else:
+                with open(path, newline='', encoding='utf-8') as f:
+                    nuclide_list, skipped = read_nuclide_file(f)
+        except (OSError, UnicodeDecodeError, ValueError, csv.Error) as e:
+            # 文件不存在/不可读、不是 UTF-8 文本或内容无法按 CSV 解析
+            printer.print_error(f"读取核素列表文件失败: {e}")
+            return None
+        if skipped:
+            printer.print_info(f"已跳过 {skipped} 个无法解析的行或核素符号")
+        if not nuclide_list:
+            printer.print_error("核素列表文件中没有可解析的核素")
+            printer.print_info("文件格式: 每行 'Z,N'（可直接使用 -o 导出的 CSV）或逗号分隔的核素符号，如 'fe56,ni60'")
+            return None
+    else:
+        nuclide_list = parse_nuclide_list(args.nuclides)
+        if not nuclide_list:
+            printer.print_error("核素列表格式错误")
+            printer.print_info("格式: 'Z1,N1;Z2,N2;...' 或 'fe56,ni60,pb208'")
+            return None
+    
+    results = query_tool.query_from_list(nuclide_list)
+    printer.print_info(f"查询指定的 {len(nuclide_list)} 个核素:")
+    print_nuclides_info(printer, results)
+    return results
+
+
+def _do_range(args, printer: NuclideRichPrinter, query_tool: NuclideQuery) -> Optional[List[Nuclide]]:
+    """区域范围查询 (-b range)，参数错误时返回 None"""
+    Z_min = Z_max = N_min = N_max = None
+    
+    # 解析质子数范围
+    if args.z_range:
+        Z_min, Z_max = parse_range(args.z_range)
+        if Z_min is None or Z_max is None:
+            printer.print_error("质子数范围格式错误，应为: min-max 或 min,max")
+            return None
+    
+    # 解析中子数范围
+    if args.n_range:
+        N_min, N_max = parse_range(args.n_range)
+        if N_min is None or N_max is None:
+            printer.print_error("中子数范围格式错误，应为: min-max 或 min,max")
+            return None
+    
+    # 至少需要一个范围参数
+    if Z_min is None and N_min is None:
+        printer.print_error("区域范围查询需要指定 --z-range 或 --n-range")
+        printer.print_info("示例: python nuclide_query.py -b range --z-range 1-10 --n-range 1-10")
+        return None
+    
+    # 如果只指定了一个范围，使用该范围查询所有可能的核素
+    if Z_min is None:
+        Z_min, Z_max = 1, 118  # 默认全部元素
+    if N_min is None:
+        N_min, N_max = 0, 200  # 默认全部中子数
+    
+    # 确保 Z_max 和 N_max 不为 None (类型检查)
+    if Z_max is None: Z_max = 118
+    if N_max is None: N_max = 200
+
+    results = query_tool.query_range(Z_min, Z_max, N_min, N_max)
+    printer.print_info(f"查询区域 Z=[{Z_min}-{Z_max}], N=[{N_min}-{N_max}]:")
+    if results:
+        print_nuclides_info(printer, results)
+    else:
+        printer.print_error("未找到任何核素数据")
+    return results
+
+
+# 批量查询模式 -> 处理函数
+BATCH_HANDLERS: Dict[str, Callable[..., Optional[List[Nuclide]]]] = {
+    'isotopes': _do_isotopes,
+    'isotones': _do_isotones,
+    'list': _do_list,
+    'range': _do_range,
+}
+
+
 def main():
     """主函数 - 支持命令行参数和交互式查询"""
     # 设置命令行参数
@@ -148,6 +377,8 @@ def main():
     %(prog)s -b isotones 50          # 查询 N=50 的所有同中子素
     %(prog)s -b range --z-range 1-10 # 查询 Z=1~10 的所有核素
     %(prog)s -b list --nuclides fe56,ni60,pb208
+    %(prog)s -b list --nuclides @list.csv  # 从文件读取核素列表（每行 Z,N 或 fe56）
+    %(prog)s -b isotopes 26 -o fe.csv  # 将查询结果导出为 CSV
     
   使用理论数据:
     %(prog)s -s SKMS fe56            # 使用 SKMS 数据源查询
@@ -176,7 +407,10 @@ def main():
     batch_group.add_argument('--n-range', type=str, metavar='MIN-MAX',
                             help='中子数范围 (用于 -b range)，如: 1-10 或 1,10')
     batch_group.add_argument('--nuclides', type=str, metavar='LIST',
-                            help='核素列表 (用于 -b list)，如: fe56,ni60,pb208 或 26,30;28,32')
+                            help='核素列表 (用于 -b list)，如: fe56,ni60,pb208 或 26,30;28,32；'
+                                 '@FILE 从文件读取，@- 从标准输入读取')
+    batch_group.add_argument('-o', '--output', type=str, metavar='FILE',
+                            help='将批量查询结果导出为 CSV 文件')
 
     # 单个核素查询参数
     parser.add_argument('input1', nargs='?', metavar='核素',
@@ -195,7 +429,7 @@ def main():
     
     # 初始化查询器
     try:
-        query_config = QueryConfig(mode=args.mode)
+        query_config = QueryConfig.for_mode(args.mode)
         printer = NuclideRichPrinter(query_config)
         query_tool = NuclideQuery(source=args.source)
         source_info = f"数据源: {args.source}" if args.source != 'experiment' else ""
@@ -208,152 +442,44 @@ def main():
     
     # 解析命令行参数
     if args.batch != 'none':
-        # 批量查询模式
-        if args.batch == 'isotopes':
-            # 同位素查询
-            if not args.input1:
-                printer.print_error("同位素查询需要指定质子数")
-                return
-            
-            try:
-                Z = int(args.input1)
-                N_min = N_max = None
-                
-                # 解析中子数范围
-                if args.n_range:
-                    N_min, N_max = parse_range(args.n_range)
-                    if N_min is None or N_max is None:
-                        printer.print_error("中子数范围格式错误，应为: min-max 或 min,max")
-                        return
-                
-                results = query_tool.query_isotopes(Z, N_min, N_max)
-                element_symbol = ELEMENT_SYMBOLS.get(Z, f"X{Z}")
-                printer.print_info(f"查询元素 {element_symbol} (Z={Z}) 的同位素:")
-                print_nuclides_info(printer, results)
-                
-            except ValueError:
-                printer.print_error("请输入有效的质子数")
-                return
+        # 批量查询模式：按模式名分派到对应的处理函数
+        results = BATCH_HANDLERS[args.batch](args, printer, query_tool)
+        if results is None:
+            return
         
-        elif args.batch == 'isotones':
-            # 同中子素查询
-            if not args.input1:
-                printer.print_error("同中子素查询需要指定中子数")
-                return
-            
+        # 导出 CSV
+        if args.output and results:
             try:
-                N = int(args.input1)
-                Z_min = Z_max = None
-                
-                # 解析质子数范围
-                if args.z_range:
-                    Z_min, Z_max = parse_range(args.z_range)
-                    if Z_min is None or Z_max is None:
-                        printer.print_error("质子数范围格式错误，应为: min-max 或 min,max")
-                        return
-                
-                results = query_tool.query_isotones(N, Z_min, Z_max)
-                printer.print_info(f"查询中子数 N={N} 的同中子素:")
-                print_nuclides_info(printer, results)
-                
-            except ValueError:
-                printer.print_error("请输入有效的中子数")
-                return
-        
-        elif args.batch == 'list':
-            # 核素列表查询
-            if not args.nuclides:
-                printer.print_error("列表查询需要使用 --nuclides 参数指定核素列表")
-                printer.print_info("格式: --nuclides 'Z1,N1;Z2,N2;...' 或 --nuclides 'fe56,ni60,pb208'")
-                return
-            
-            nuclide_list = parse_nuclide_list(args.nuclides)
-            if not nuclide_list:
-                printer.print_error("核素列表格式错误")
-                printer.print_info("格式: 'Z1,N1;Z2,N2;...' 或 'fe56,ni60,pb208'")
-                return
-            
-            results = query_tool.query_from_list(nuclide_list)
-            printer.print_info(f"查询指定的 {len(nuclide_list)} 个核素:")
-            print_nuclides_info(printer, results)
-        
-        elif args.batch == 'range':
-            # 区域范围查询
-            Z_min = Z_max = N_min = N_max = None
-            
-            # 解析质子数范围
-            if args.z_range:
-                Z_min, Z_max = parse_range(args.z_range)
-                if Z_min is None or Z_max is None:
-                    printer.print_error("质子数范围格式错误，应为: min-max 或 min,max")
-                    return
-            
-            # 解析中子数范围
-            if args.n_range:
-                N_min, N_max = parse_range(args.n_range)
-                if N_min is None or N_max is None:
-                    printer.print_error("中子数范围格式错误，应为: min-max 或 min,max")
-                    return
-            
-            # 至少需要一个范围参数
-            if Z_min is None and N_min is None:
-                printer.print_error("区域范围查询需要指定 --z-range 或 --n-range")
-                printer.print_info("示例: python nuclide_query.py -b range --z-range 1-10 --n-range 1-10")
-                return
-            
-            # 如果只指定了一个范围，使用该范围查询所有可能的核素
-            if Z_min is None:
-                Z_min, Z_max = 1, 118  # 默认全部元素
-            if N_min is None:
-                N_min, N_max = 0, 200  # 默认全部中子数
-            
-            # 确保 Z_max 和 N_max 不为 None (类型检查)
-            if Z_max is None: Z_max = 118
-            if N_max is None: N_max = 200
-
-            results = query_tool.query_range(Z_min, Z_max, N_min, N_max)
-            printer.print_info(f"查询区域 Z=[{Z_min}-{Z_max}], N=[{N_min}-{N_max}]:")
-            if results:
-                print_nuclides_info(printer, results)
-            else:
-                printer.print_error("未找到任何核素数据")
+                count = query_tool.export_csv([(nuc.Z, nuc.N) for nuc in results], args.output)
+                printer.print_success(f"已导出 {count} 个核素到 {args.output}")
+            except OSError as e:
+                printer.print_error(f"导出 CSV 失败: {e}")
         
         return
     
     elif args.input1 is not None:
-        Z = N = None
-        
         if args.input2 is not None:
             # 两个参数：质子数和中子数
-            try:
-                Z = int(args.input1)
-                N = int(args.input2)
-                if Z <= 0 or N < 0:
-                    printer.print_error("质子数必须大于0，中子数必须大于等于0")
-                    return
-            except ValueError:
+            Z = parse_int(args.input1)
+            N = parse_int(args.input2)
+            if Z is None or N is None:
                 printer.print_error("请输入有效的整数")
                 return
+            if Z <= 0 or N < 0:
+                printer.print_error("质子数必须大于0，中子数必须大于等于0")
+                return
+        elif parse_int(args.input1) is not None:
+            # 单个整数参数：只给出了质子数
+            printer.print_error("缺少中子数参数")
+            return
         else:
-            # 单个参数：尝试解析为质子数或元素符号+质量数
-            try:
-                # 先尝试作为质子数解析
-                Z = int(args.input1)
-                printer.print_error("缺少中子数参数")
+            # 作为元素符号+质量数解析
+            Z, N = parse_nuclide_string(args.input1)
+            if Z is None or N is None:
+                printer.print_error(f"无法解析核素字符串: {args.input1}")
+                printer.print_info("格式应为: 元素符号+质量数，如 fe56, al31, pb208")
                 return
-            except ValueError:
-                # 作为元素符号+质量数解析
-                Z, N = parse_nuclide_string(args.input1)
-                if Z is None or N is None:
-                    printer.print_error(f"无法解析核素字符串: {args.input1}")
-                    printer.print_info("格式应为: 元素符号+质量数，如 fe56, al31, pb208")
-                    return
         
-        # 显示解析结果
-        element_symbol = ELEMENT_SYMBOLS.get(Z, f"X{Z}")
-        A = Z + N
-        # print(f"查询核素: {A}{element_symbol} (Z={Z}, N={N})")
-        # print(f"查询模式: {args.mode}")
         print_nuclide_info(printer, query_tool, Z, N)
         return
     
@@ -366,21 +492,14 @@ def main():
         
         # 获取用户输入
         try:
-            user_input = input("🔬 请输入质子数: ").strip()
-            if user_input.lower() == 'q':
+            Z = read_int(printer, "🔬 请输入质子数: ")
+            if Z is None:
                 break
-                
-            Z = int(user_input)
             
-            user_input = input("⚛️  请输入中子数: ").strip()
-            if user_input.lower() == 'q':
+            N = read_int(printer, "⚛️  请输入中子数: ")
+            if N is None:
                 break
-                
-            N = int(user_input)
             
-        except ValueError:
-            printer.print_error("请输入有效的整数!")
-            continue
         except KeyboardInterrupt:
             printer.print_info("程序被用户中断")
             break
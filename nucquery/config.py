@@ -2,16 +2,34 @@
 # Nuclide Query Tool Configuration
 
 
-from dataclasses import dataclass
+from dataclasses import InitVar, dataclass, fields
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, Optional, Tuple
+
+from .nuclide_data import _DATACLASS_OPTIONS
+
+__all__ = [
+    'QueryConfig',
+    'BATCH_QUERY_CSV_FIELDS',
+    'DATA_FILE_PATH',
+]
 
 # ====================================================
 # 查询配置定义
 # ====================================================
 
-# 查询配置相关
-@dataclass
+# 查询配置相关（slots 需要 Python 3.10+，旧版本退化为普通 frozen dataclass）
+@dataclass(frozen=True, **_DATACLASS_OPTIONS)
 class QueryConfig:
-    """查询配置类"""
+    """
+    查询配置类（不可变，使用 dataclasses.replace 派生新配置）
+    
+    兼容旧接口：QueryConfig("detailed") 或 QueryConfig(mode="detailed") 按预定义模式创建，
+    其余开关只能以关键字参数指定，且必须为 bool
+    """
+    # 预定义模式 ('basic', 'detailed', 'minimal')，仅用于构造，不作为字段保存
+    mode: InitVar[Optional[str]] = None
+    
     # 块信息显示
     show_minimal_info: bool = False
     show_energy_info : bool = True
@@ -74,29 +92,107 @@ class QueryConfig:
     energy_unit: str = "MeV"  # "MeV" 或 "keV"
     decimal_places: int = 3
 
-    # 预定义的查询配置
-    def __init__(self, mode: str = "basic"):
-        if mode == "basic":
-            pass
-        elif mode == "detailed":
-            self.show_energy_info = True
-            self.show_separation_info = True
-            self.show_Q_values = True
-            self.show_excitation_energy = True
-            self.show_fission_yields = True
-            self.show_levels = True
-            self.show_uncertainties = True
-        elif mode == "minimal":
-            self.show_minimal_info = True
-            self.show_energy_info = False
-            self.show_separation_info = False
-            self.show_Q_values = False
-            self.show_excitation_energy = False
-            self.show_fission_yields = False
-            self.show_levels = False
-            self.show_uncertainties = False
-        else:
+    def __post_init__(self, mode: Optional[str]):
+        # 开关误传为字符串等非 bool 值时（如位置参数错位）会被当作真值，直接报错
+        for name in _BOOL_FIELDS:
+            value = getattr(self, name)
+            if type(value) is not bool:
+                raise TypeError(f"QueryConfig.{name} 必须为 bool，得到 {value!r}")
+        if mode is None:
+            return
+        patch = _MODE_PATCHES.get(mode)
+        if patch is None:
             print(f"未知查询模式: {mode}, 使用默认配置")
+            return
+        for name, value in patch.items():
+            object.__setattr__(self, name, value)
+
+    @classmethod
+    def for_mode(cls, mode: str = "basic") -> "QueryConfig":
+        """
+        按预定义模式创建查询配置
+        
+        参数:
+            mode: 查询模式 ('basic', 'detailed', 'minimal')
+        """
+        return cls(mode)
+
+    @property
+    def required_fields(self) -> FrozenSet[str]:
+        """当前配置会显示的字段（数据键，含 'levels'），可传给数据源以只解析这些字段"""
+        return _required_fields(self)
+
+
+# 取值必须为 bool 的显示开关
+_BOOL_FIELDS: Tuple[str, ...] = tuple(f.name for f in fields(QueryConfig) if f.type is bool)
+
+# 预定义的查询模式：相对默认配置需要修改的字段
+_MODE_PATCHES: Dict[str, Dict[str, Any]] = {
+    "basic": {},
+    "detailed": {
+        "show_energy_info": True,
+        "show_separation_info": True,
+        "show_Q_values": True,
+        "show_excitation_energy": True,
+        "show_fission_yields": True,
+        "show_levels": True,
+        "show_uncertainties": True,
+    },
+    "minimal": {
+        "show_minimal_info": True,
+        "show_energy_info": False,
+        "show_separation_info": False,
+        "show_Q_values": False,
+        "show_excitation_energy": False,
+        "show_fission_yields": False,
+        "show_levels": False,
+        "show_uncertainties": False,
+    },
+}
+
+# 显示开关与数据字段的对应关系: (分块开关, 条目开关, 数据键)
+_FIELD_FLAGS: Tuple[Tuple[str, str, str], ...] = (
+    ("show_minimal_info", "show_minimal_info", "bindingEnergy"),
+    ("show_energy_info", "show_binding_energy", "bindingEnergy"),
+    ("show_energy_info", "show_binding_energy_per_nucleon", "bindingEnergyPerNucleon"),
+    ("show_separation_info", "show_neutron_separation", "neutronSeparationEnergy"),
+    ("show_separation_info", "show_proton_separation", "protonSeparationEnergy"),
+    ("show_separation_info", "show_two_neutron_separation", "twoNeutronSeparationEnergy"),
+    ("show_separation_info", "show_two_proton_separation", "twoProtonSeparationEnergy"),
+    ("show_Q_values", "show_alpha_separation", "alpha"),
+    ("show_Q_values", "show_delta_alpha", "deltaAlpha"),
+    ("show_Q_values", "show_beta_minus", "betaMinus"),
+    ("show_Q_values", "show_electron_capture", "electronCapture"),
+    ("show_Q_values", "show_positron_emission", "positronEmission"),
+    ("show_Q_values", "show_beta_minus_one_neutron_emission", "betaMinusOneNeutronEmission"),
+    ("show_Q_values", "show_beta_minus_two_neutron_emission", "betaMinusTwoNeutronEmission"),
+    ("show_Q_values", "show_electron_capture_one_proton_emission", "electronCaptureOneProtonEmission"),
+    ("show_Q_values", "show_double_beta_minus", "doubleBetaMinus"),
+    ("show_Q_values", "show_double_electron_capture", "doubleElectronCapture"),
+    ("show_excitation_energy", "show_first_excitation_energy", "firstExcitedStateEnergy"),
+    ("show_excitation_energy", "show_first_2plus_energy", "firstTwoPlusEnergy"),
+    ("show_excitation_energy", "show_first_4plus_energy", "firstFourPlusEnergy"),
+    ("show_excitation_energy", "show_first_4plus_divided_by_2plus", "firstFourPlusOverFirstTwoPlusEnergy"),
+    ("show_excitation_energy", "show_first_3minus_energy", "firstThreeMinusEnergy"),
+    ("show_fission_yields", "show_u235_ify", "FY235U"),
+    ("show_fission_yields", "show_u238_ify", "FY238U"),
+    ("show_fission_yields", "show_pu239_ify", "FY239Pu"),
+    ("show_fission_yields", "show_cf252_ify", "FY252Cf"),
+    ("show_fission_yields", "show_u235_cfy", "cFY235U"),
+    ("show_fission_yields", "show_u238_cfy", "cFY238U"),
+    ("show_fission_yields", "show_pu239_cfy", "cFY239Pu"),
+    ("show_fission_yields", "show_cf252_cfy", "cFY252Cf"),
+    ("show_levels", "show_levels", "levels"),
+)
+
+
+@lru_cache(maxsize=None)
+def _required_fields(config: QueryConfig) -> FrozenSet[str]:
+    """按显示开关计算所需字段（配置不可变，结果按配置缓存）"""
+    return frozenset(
+        key for block, item, key in _FIELD_FLAGS
+        if getattr(config, block) and getattr(config, item)
+    )
 
 # ====================================================
 # 批量查询配置
@@ -115,5 +211,6 @@ BATCH_QUERY_CSV_FIELDS = [
 # 显示格式配置
 # ====================================================
 
-# 数据文件路径
+# 实验数据文件路径（相对于 nucquery 包目录）
 DATA_FILE_PATH = "data/nndc_nudat_data_export.json"
+
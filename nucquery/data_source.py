@@ -4,16 +4,318 @@
 定义统一的数据源接口，支持实验数据和理论计算数据
 """
 
+import gc
+import hashlib
 import json
+import mmap
+import os
+import pickle
+import struct
+import warnings
+from sys import intern
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Set
-from dataclasses import dataclass
+from typing import Any, BinaryIO, Callable, Dict, FrozenSet, Iterable, Iterator, List, Optional, Tuple
 
 from .nuclide_data import (
     ValueWithUncertainty, NuclideProperties, LevelInfo, DecayModeInfo,
-    ELEMENT_SYMBOLS, HALF_LIFE_UNITS
+    ELEMENT_SYMBOLS
 )
+from .config import DATA_FILE_PATH
+from .nuclide_table import NuclideTable
+
+# 实验数据文件名（数据目录由 DataSourceManager 指定）
+_EXPERIMENT_FILENAME = Path(DATA_FILE_PATH).name
+
+# 实验数据源的名称（小写）
+_EXPERIMENT_ALIASES: FrozenSet[str] = frozenset({'experiment', 'exp', 'nndc'})
+
+# 可选依赖：msgspec 的 JSON 解码最快，且结果与标准库 json 完全一致（包括超出 64 位的整数）
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+
+# 多进程解析的最少条目数：更小的文件启动子进程的开销超过并行收益，在当前进程中解析
+PARALLEL_MIN_ITEMS = 500
+
+
+# ==================== JSON 解析缓存 ====================
+
+# 进程内已解析数据缓存: (文件路径, 修改时间, 字段子集) -> {(Z, N): NuclideProperties}
+# 字段子集为 None 表示完整数据
+_PARSED_CACHE: Dict[Tuple[str, float, Optional[FrozenSet[str]]],
+                    Dict[Tuple[int, int], NuclideProperties]] = {}
+
+
+# ==================== 实验数据字段表 ====================
+
+# 需要从 keV 转换为 MeV 的字段（结合能单独处理）
+_MEV_FIELDS: Tuple[str, ...] = (
+    # 分离能
+    'neutronSeparationEnergy',
+    'protonSeparationEnergy',
+    'twoNeutronSeparationEnergy',
+    'twoProtonSeparationEnergy',
+    # Q 值
+    'alpha',
+    'betaMinus',
+    'electronCapture',
+    # 激发态能量
+    'firstExcitedStateEnergy',
+    'firstTwoPlusEnergy',
+    'firstFourPlusEnergy',
+    'firstThreeMinusEnergy',
+)
+
+# 保持原单位的字段（裂变产额）
+_RAW_FIELDS: Tuple[str, ...] = (
+    'FY235U', 'FY238U', 'FY239Pu', 'FY252Cf',
+    'cFY235U', 'cFY238U', 'cFY239Pu', 'cFY252Cf',
+)
+
+# 理论数据文件中的能量列: (NuclideProperties 键, 列号)，单位 MeV
+# 列顺序: 符号 Z N A BE Sp S2p Sn S2n Q_alpha
+_THEORY_COLUMNS: Tuple[Tuple[str, int], ...] = (
+    ('neutronSeparationEnergy', 7),
+    ('protonSeparationEnergy', 5),
+    ('twoNeutronSeparationEnergy', 8),
+    ('twoProtonSeparationEnergy', 6),
+    ('alpha', 9),
+)
+
+def _intern(text):
+    """单位、衰变模式、自旋宇称等重复出现的短字符串共用同一对象（pickle 缓存中也只写一次）"""
+    return intern(text) if type(text) is str else text
+
+
+# 缺失值的共享默认对象（所有核素共用同一实例，调用方不应修改其属性）
+_ZERO_ENERGY = ValueWithUncertainty(value=0)
+_EMPTY_VALUE = ValueWithUncertainty()
+
+# 稳定核素的基态半衰期在 JSON 中均为 {"value": "STABLE"}，解析为同一共享实例
+_STABLE_RAW = {'value': 'STABLE'}
+_STABLE_HALFLIFE = ValueWithUncertainty('STABLE', None, '')
+
+
+# ==================== 同位素/同中子素索引 ====================
+
+def _build_grid(data: Dict[Tuple[int, int], NuclideProperties]) -> List[List[Optional[NuclideProperties]]]:
+    """
+    构建稠密查找表 grid[Z][N] -> NuclideProperties（空位为 None）
+    
+    Z、N 都很小（约 120 x 180），两次列表下标比元组哈希 + 字典查找更快
+    """
+    if not data:
+        return []
+    width = max(N for _, N in data) + 1
+    grid: List[List[Optional[NuclideProperties]]] = [[None] * width for _ in range(max(Z for Z, _ in data) + 1)]
+    for (Z, N), props in data.items():
+        grid[Z][N] = props
+    return grid
+
+
+# 同位素/同中子素链: (已排序的 N 或 Z 列表, 对应的 NuclideProperties 列表)
+_Chain = Tuple[List[int], List[NuclideProperties]]
+_EMPTY_CHAIN: _Chain = ([], [])
+
+
+def _build_index(data: Dict[Tuple[int, int], NuclideProperties]) -> Tuple[Dict[int, _Chain], Dict[int, _Chain]]:
+    """
+    构建倒排索引，链上的核素数据预先按顺序分好桶
+    
+    返回:
+        (by_Z, by_N)：Z -> 按 N 排序的同位素链，N -> 按 Z 排序的同中子素链
+    """
+    by_Z: Dict[int, _Chain] = defaultdict(lambda: ([], []))
+    by_N: Dict[int, _Chain] = defaultdict(lambda: ([], []))
+    for Z, N in sorted(data):
+        props = data[(Z, N)]
+        keys, records = by_Z[Z]
+        keys.append(N)
+        records.append(props)
+        keys, records = by_N[N]
+        keys.append(Z)
+        records.append(props)
+    return dict(by_Z), dict(by_N)
+
+
+def _lookup_pairs(data: Dict[Tuple[int, int], NuclideProperties],
+                  nuclide_list: List[Tuple[int, int]]) -> List[Optional[NuclideProperties]]:
+    """
+    批量按 (Z, N) 查找；元素本身是元组时直接作为键（不重建元组，比逐个解包快约 2.5 倍）
+    """
+    try:
+        return list(map(data.get, nuclide_list))
+    except TypeError:
+        # 元素为列表等不可哈希的序列：逐个转换为元组
+        get = data.get
+        return [get((Z, N)) for Z, N in nuclide_list]
+
+
+def _window(chain: _Chain, lo: Optional[int], hi: Optional[int]) -> List[NuclideProperties]:
+    """用二分查找截取链中键在 [lo, hi] 范围内的核素数据（None 表示不限），返回新列表"""
+    keys, records = chain
+    start = 0 if lo is None else bisect_left(keys, lo)
+    end = len(keys) if hi is None else bisect_right(keys, hi)
+    return records[start:end]
+
+
+# ==================== 磁盘缓存 ====================
+
+# 缓存格式版本（NuclideProperties 的结构或解析结果改变时递增，旧缓存自动失效）
+# 2: 超出 64 位的整数按 JSON 原值保留（不再被 orjson 转为浮点数）
+# 3: 解析能级的衰变模式 (decayModes)
+# 4: 缺失的数值字段不再以 None 写入记录字典
+# 5: 理论数据缺失的结合能同样不写入
+# 6: 不再使用 orjson 解析（其将超出 64 位的整数转为浮点数，旧缓存可能由其生成）
+_DISK_CACHE_VERSION = 6
+
+
+# 缓存文件头：魔数、缓存格式版本、数据文件指纹 (修改时间 ns, 大小)
+# 用 struct 定长编码，校验通过之后才反序列化 pickle 数据
+_CACHE_HEADER = struct.Struct('<8sIqQ')
+_CACHE_MAGIC = b'NUCQPKL\0'
+
+
+def _cache_dir() -> Path:
+    """
+    缓存目录：环境变量 NUCQUERY_CACHE_DIR 优先，否则为当前用户的缓存目录
+    
+    缓存不写在数据文件旁边：安装目录可能只读或被多个用户共享，
+    且反序列化他人放置的 pickle 文件会执行任意代码
+    """
+    override = os.environ.get('NUCQUERY_CACHE_DIR')
+    if override:
+        return Path(override)
+    if os.name == 'nt':
+        base = os.environ.get('LOCALAPPDATA') or Path.home() / 'AppData' / 'Local'
+        return Path(base) / 'nucquery' / 'Cache'
+    base = os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache'
+    return Path(base) / 'nucquery'
+
+
+def _cache_path(data_file: Path, suffix: str) -> Path:
+    """缓存文件路径：文件名加上数据文件绝对路径的摘要，不同目录下的同名文件互不覆盖"""
+    digest = hashlib.sha256(str(data_file.resolve()).encode('utf-8')).hexdigest()[:16]
+    return _cache_dir() / f"{data_file.name}.{digest}{suffix}"
+
+
+def _disk_cache_path(data_file: Path) -> Path:
+    """解析结果缓存文件路径（如 xxx.json.<摘要>.cache.pkl）"""
+    return _cache_path(data_file, '.cache.pkl')
+
+
+def _table_cache_path(data_file: Path) -> Path:
+    """列式存储缓存文件路径（如 xxx.json.<摘要>.table.bin）"""
+    return _cache_path(data_file, '.table.bin')
+
+
+def _file_stamp(path: Path) -> Tuple[int, int]:
+    """文件指纹 (修改时间 ns, 大小)，用于判断缓存是否过期"""
+    st = path.stat()
+    return st.st_mtime_ns, st.st_size
+
+
+def _cache_header(data_file: Path) -> bytes:
+    """当前数据文件对应的缓存文件头"""
+    return _CACHE_HEADER.pack(_CACHE_MAGIC, _DISK_CACHE_VERSION, *_file_stamp(data_file))
+
+
+def _read_disk_cache(data_file: Path) -> Optional[Dict[Tuple[int, int], NuclideProperties]]:
+    """
+    读取解析结果缓存
+    
+    返回:
+        缓存的数据；缓存不存在、已过期或损坏时返回 None
+    """
+    gc_was_enabled = gc.isenabled()
+    try:
+        with open(_disk_cache_path(data_file), 'rb') as f:
+            if f.read(_CACHE_HEADER.size) != _cache_header(data_file):
+                return None
+            # 反序列化一次性创建数十万个对象且都不是垃圾，期间暂停循环垃圾回收（加载约快一倍）
+            gc.disable()
+            return pickle.load(f)
+    except Exception:
+        # 缓存只是加速手段，任何读取问题都退回到重新解析
+        return None
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+
+def _atomic_write(path: Path, write: Callable[[BinaryIO], None]):
+    """先写临时文件再原子替换，避免其他进程读到写了一半的缓存；目录不可写时静默跳过"""
+    tmp_file = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        with open(tmp_file, 'wb') as f:
+            write(f)
+        os.replace(tmp_file, path)
+    except OSError:
+        try:
+            tmp_file.unlink()
+        except OSError:
+            pass
+
+
+def _write_disk_cache(data_file: Path, data: Dict[Tuple[int, int], NuclideProperties]):
+    """写入解析结果缓存"""
+    def write(f):
+        f.write(_cache_header(data_file))
+        pickle.dump(data, f, pickle.HIGHEST_PROTOCOL)
+    _atomic_write(_disk_cache_path(data_file), write)
+
+
+def _load_or_build_table(data_file: Path, build: Callable[[], NuclideTable]) -> NuclideTable:
+    """
+    优先以内存映射方式读取列式存储缓存，否则调用 build 构建并写入缓存
+    
+    缓存有效时无需加载/解析数据文件本身
+    """
+    table_file = _table_cache_path(data_file)
+    # 列由解析结果导出：解析缓存版本变化时列式存储同样失效
+    stamp = (_DISK_CACHE_VERSION, *_file_stamp(data_file))
+    table = NuclideTable.load(table_file, stamp)
+    if table is None:
+        table = build()
+        _atomic_write(table_file, lambda f: table.save(f, stamp))
+    return table
+
+
+def _iter_json_items(path: Path) -> Iterator[Tuple[str, Any]]:
+    """
+    逐个生成 JSON 顶层对象的 (键, 值)
+    
+    安装了 msgspec 时直接解析内存映射的文件内容（不复制出 bytes 缓冲区），否则使用标准库 json，
+    两者的解析结果完全一致；整体解析后逐个弹出条目，已处理的原始条目可随即被回收
+    """
+    if msgspec is not None and path.stat().st_size > 0:
+        with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view:
+                raw = msgspec.json.decode(view)
+    else:
+        buf = path.read_bytes()
+        raw = json.loads(buf)
+        del buf
+    pop = raw.pop
+    for key in list(raw):
+        yield key, pop(key)
+
+
+def _split_json_entries(path: Path) -> List[Tuple[str, bytes]]:
+    """
+    将 JSON 顶层对象切分为 (键, 值的 JSON 字节串)，不解码各条目的内容（需要 msgspec）
+    
+    只扫描顶层结构，耗时约为整体解码的八分之一；字节串可廉价地传给子进程分别解码
+    """
+    raw = msgspec.json.decode(path.read_bytes(), type=Dict[str, msgspec.Raw])
+    return [(key, bytes(value)) for key, value in raw.items()]
 
 
 # ==================== 数据源基类 ====================
@@ -61,15 +363,44 @@ class DataSource(ABC):
     def list_nuclides(self) -> List[Tuple[int, int]]:
         """列出所有可用核素的 (Z, N) 列表"""
         pass
-    
-    def get_isotopes(self, Z: int) -> List[NuclideProperties]:
+
+    def get_nuclides(self, nuclide_list: List[Tuple[int, int]]) -> List[Optional[NuclideProperties]]:
+        """
+        批量获取核素数据
+        默认实现：逐个调用 get_nuclide（子类可优化）
+
+        参数:
+            nuclide_list: [(Z1, N1), (Z2, N2), ...] 的列表
+
+        返回:
+            与输入顺序一致的 NuclideProperties 列表，未找到的位置为 None
+        """
+        return [self.get_nuclide(Z, N) for Z, N in nuclide_list]
+
+    def known_pairs(self) -> FrozenSet[Tuple[int, int]]:
+        """
+        所有可用核素的 (Z, N) 集合，用于 O(1) 判断核素是否存在
+        默认实现：由 list_nuclides 构建（子类可缓存）
+        """
+        return frozenset(self.list_nuclides())
+
+    def get_table(self) -> NuclideTable:
         """
-        获取指定质子数的所有同位素数据
+        获取标量数据的列式存储，用于批量读取数值
+        默认实现：由 list_nuclides/get_nuclides 构建（子类可缓存）
+        """
+        pairs = self.list_nuclides()
+        return NuclideTable(dict(zip(pairs, self.get_nuclides(pairs))))
+
+    def get_isotopes(self, Z: int, N_min: Optional[int] = None,
+                     N_max: Optional[int] = None) -> List[NuclideProperties]:
+        """
+        获取指定质子数的所有同位素数据（可限定中子数范围）
         默认实现：遍历 list_nuclides 进行筛选（子类可优化）
         """
         results = []
         for z, n in self.list_nuclides():
-            if z == Z:
+            if z == Z and (N_min is None or n >= N_min) and (N_max is None or n <= N_max):
                 data = self.get_nuclide(z, n)
                 if data:
                     results.append(data)
@@ -77,14 +408,15 @@ class DataSource(ABC):
         results.sort(key=lambda x: x['N'])
         return results
 
-    def get_isotones(self, N: int) -> List[NuclideProperties]:
+    def get_isotones(self, N: int, Z_min: Optional[int] = None,
+                     Z_max: Optional[int] = None) -> List[NuclideProperties]:
         """
-        获取指定中子数的所有同中子素数据
+        获取指定中子数的所有同中子素数据（可限定质子数范围）
         默认实现：遍历 list_nuclides 进行筛选
         """
         results = []
         for z, n in self.list_nuclides():
-            if n == N:
+            if n == N and (Z_min is None or z >= Z_min) and (Z_max is None or z <= Z_max):
                 data = self.get_nuclide(z, n)
                 if data:
                     results.append(data)
@@ -94,9 +426,95 @@ class DataSource(ABC):
 
 
 
+class IndexedDataSource(DataSource):
+    """
+    整体载入内存的数据源
+    
+    子类只需实现 _load_data（填充 self._data）；首次查询时载入数据并建立稠密查找表与
+    同位素/同中子素索引，单点、批量与链查询均由本类基于这些索引实现
+    """
+    
+    def __init__(self):
+        # 数据缓存
+        self._data: Dict[Tuple[int, int], NuclideProperties] = {}
+        self._known_pairs: FrozenSet[Tuple[int, int]] = frozenset()
+        self._table: Optional[NuclideTable] = None
+        self._by_Z: Dict[int, _Chain] = {}
+        self._by_N: Dict[int, _Chain] = {}
+        self._grid: List[List[Optional[NuclideProperties]]] = []
+        self._loaded = False
+    
+    @abstractmethod
+    def _load_data(self):
+        """加载数据，将 {(Z, N): NuclideProperties} 写入 self._data"""
+        pass
+    
+    def _table_file(self) -> Optional[Path]:
+        """列式存储缓存所对应的数据文件；返回 None 时每次在内存中构建，不读写磁盘缓存"""
+        return None
+    
+    def _ensure_loaded(self):
+        """确保数据已加载"""
+        if not self._loaded:
+            self._load_data()
+            self._known_pairs = frozenset(self._data)
+            self._by_Z, self._by_N = _build_index(self._data)
+            self._grid = _build_grid(self._data)
+            self._loaded = True
+    
+    def get_nuclide(self, Z: int, N: int) -> Optional[NuclideProperties]:
+        if not self._loaded:  # 单点查询的热路径：已加载时省去一次方法调用
+            self._ensure_loaded()
+        try:
+            return self._grid[Z][N] if Z >= 0 and N >= 0 else None
+        except (IndexError, TypeError):
+            # 超出查找表范围，或 Z/N 不是整数：按字典查找
+            return self._data.get((Z, N))
+    
+    def get_nuclides(self, nuclide_list: List[Tuple[int, int]]) -> List[Optional[NuclideProperties]]:
+        self._ensure_loaded()
+        return _lookup_pairs(self._data, nuclide_list)
+    
+    def has_nuclide(self, Z: int, N: int) -> bool:
+        if not self._loaded:  # 单点查询的热路径：已加载时省去一次方法调用
+            self._ensure_loaded()
+        return (Z, N) in self._data
+    
+    def list_nuclides(self) -> List[Tuple[int, int]]:
+        self._ensure_loaded()
+        return list(self._data.keys())
+    
+    def known_pairs(self) -> FrozenSet[Tuple[int, int]]:
+        self._ensure_loaded()
+        return self._known_pairs
+    
+    def get_table(self) -> NuclideTable:
+        if self._table is None:
+            table_file = self._table_file()
+            if table_file is None:
+                self._table = self._build_table()
+            else:
+                self._table = _load_or_build_table(table_file, self._build_table)
+        return self._table
+    
+    def _build_table(self) -> NuclideTable:
+        self._ensure_loaded()
+        return NuclideTable(self._data)
+    
+    def get_isotopes(self, Z: int, N_min: Optional[int] = None,
+                     N_max: Optional[int] = None) -> List[NuclideProperties]:
+        self._ensure_loaded()
+        return _window(self._by_Z.get(Z, _EMPTY_CHAIN), N_min, N_max)
+    
+    def get_isotones(self, N: int, Z_min: Optional[int] = None,
+                     Z_max: Optional[int] = None) -> List[NuclideProperties]:
+        self._ensure_loaded()
+        return _window(self._by_N.get(N, _EMPTY_CHAIN), Z_min, Z_max)
+
+
 # ==================== 实验数据源 ====================
 
-class ExperimentalDataSource(DataSource):
+class ExperimentalDataSource(IndexedDataSource):
     """
     NNDC 实验数据源
     
@@ -104,15 +522,32 @@ class ExperimentalDataSource(DataSource):
     包含结合能、分离能、半衰期、衰变模式等完整实验数据
     """
     
-    def __init__(self, data_file: Optional[str] = None):
+    def __init__(self, data_file: Optional[str] = None, workers: Optional[int] = 1,
+                 fields: Optional[FrozenSet[str]] = None):
+        """
+        参数:
+            data_file: JSON 数据文件路径 (默认使用包内数据)
+            workers: 首次解析 JSON 时使用的进程数 (1 表示在当前进程中解析，
+                     None 表示使用全部 CPU 核心；条目少于 PARALLEL_MIN_ITEMS 时总在当前进程中解析)
+            fields: 只解析这些字段 (如 QueryConfig.required_fields)；
+                    None 表示解析全部字段。不含 'levels' 时只解析基态能级。
+                    已有完整数据（进程内或磁盘缓存）时直接复用，裁剪解析的结果不写入磁盘缓存
+        """
         if data_file is None:
-            self.data_file = Path(__file__).parent / 'data' / 'nndc_nudat_data_export.json'
+            self.data_file = Path(__file__).parent / DATA_FILE_PATH
         else:
             self.data_file = Path(data_file)
+        self.workers = max(1, os.cpu_count() or 1) if workers is None else max(1, workers)
+        self.fields = fields
+        if fields is None:
+            self._mev_fields, self._raw_fields = _MEV_FIELDS, _RAW_FIELDS
+        else:
+            self._mev_fields = tuple(key for key in _MEV_FIELDS if key in fields)
+            self._raw_fields = tuple(key for key in _RAW_FIELDS if key in fields)
+        # fields 中不含 'levels' 时，能级列表只保留基态
+        self._ground_only = fields is not None and 'levels' not in fields
         
-        # 数据缓存
-        self._data: Dict[Tuple[int, int], NuclideProperties] = {}
-        self._loaded = False
+        super().__init__()
     
     @property
     def name(self) -> str:
@@ -126,100 +561,173 @@ class ExperimentalDataSource(DataSource):
     def is_theoretical(self) -> bool:
         return False
     
-    def _ensure_loaded(self):
-        """确保数据已加载"""
-        if not self._loaded:
-            self._load_data()
-            self._loaded = True
-    
     def _load_data(self):
         """加载 JSON 数据"""
         if not self.data_file.exists():
             raise FileNotFoundError(f"数据文件不存在: {self.data_file}")
         
-        with open(self.data_file, 'r', encoding='utf-8') as f:
-            raw_data = json.load(f)
+        # 同一文件在本进程中只解析一次（文件修改后自动失效）；
+        # 完整数据是任意字段子集的超集，已有时裁剪解析也直接使用（比重新解析 JSON 快得多）
+        file_key = (str(self.data_file.resolve()), self.data_file.stat().st_mtime)
+        cache_key = (*file_key, self.fields)
+        full_key = (*file_key, None)
+        cached = _PARSED_CACHE.get(cache_key)
+        if cached is None:
+            cached = _PARSED_CACHE.get(full_key)
+        if cached is not None:
+            self._data = cached
+            return
         
-        for nuclide_name, nuclide_dict in raw_data.items():
-            if not isinstance(nuclide_dict, dict):
-                continue
-            
-            Z = nuclide_dict.get('z')
-            N = nuclide_dict.get('n')
-            A = nuclide_dict.get('a')
-            
-            if Z is None or N is None:
+        # 其次使用磁盘上的解析结果缓存（跳过 JSON 解析；缓存总是完整数据）
+        cached = _read_disk_cache(self.data_file)
+        if cached is not None:
+            self._data = _PARSED_CACHE[full_key] = cached
+            return
+        
+        encoded = self.workers > 1 and msgspec is not None
+        if encoded:
+            # 只切分顶层对象，各条目保持为 JSON 字节串，解码也交给子进程并行完成
+            items = _split_json_entries(self.data_file)
+        else:
+            items = _iter_json_items(self.data_file)
+            if self.workers > 1:
+                items = list(items)
+        if self.workers > 1 and len(items) >= PARALLEL_MIN_ITEMS:
+            # 各条目互不依赖：分块交给子进程解析，按原顺序合并
+            size = -(-len(items) // self.workers)
+            chunks = [items[i:i + size] for i in range(0, len(items), size)]
+            n = len(chunks)
+            skipped = 0
+            with ProcessPoolExecutor(max_workers=self.workers) as pool:
+                for parsed, chunk_skipped in pool.map(_parse_chunk, chunks, [self.fields] * n, [encoded] * n):
+                    self._data.update(parsed)
+                    skipped += chunk_skipped
+        elif encoded:
+            decode = msgspec.json.decode
+            self._data, skipped = self._parse_items((name, decode(raw)) for name, raw in items)
+        else:
+            self._data, skipped = self._parse_items(items)
+        if skipped:
+            warnings.warn(f"{self.data_file.name}: 跳过 {skipped} 个格式错误的核素条目", stacklevel=2)
+        
+        _PARSED_CACHE[cache_key] = self._data
+        if self.fields is None:
+            _write_disk_cache(self.data_file, self._data)
+    
+    def _parse_items(self, items: Iterable[Tuple[str, Any]]) -> Tuple[Dict[Tuple[int, int], NuclideProperties], int]:
+        """
+        逐个解析 JSON 条目
+        
+        单个条目格式错误（字段类型不符等）时跳过该条目，不中断整个文件的加载
+        
+        返回:
+            ({(Z, N): NuclideProperties}, 跳过的条目数)
+        """
+        parse = self._parse_nuclide
+        data = {}
+        skipped = 0
+        for nuclide_name, nuclide_dict in items:
+            try:
+                props = parse(nuclide_name, nuclide_dict)
+            except (KeyError, TypeError, AttributeError, ValueError):
+                skipped += 1
                 continue
+            if props is not None:
+                data[(props['Z'], props['N'])] = props
+        return data, skipped
+    
+    def _parse_nuclide(self, nuclide_name: str, nuclide_dict) -> Optional[NuclideProperties]:
+        """
+        解析单个核素条目
+        
+        参数:
+            nuclide_name: JSON 中的核素键名
+            nuclide_dict: 该核素的原始字典
             
-            # 解析能级信息
-            levels = []
-            ground_state = None
-            if 'levels' in nuclide_dict and nuclide_dict['levels']:
-                for level_data in nuclide_dict['levels']:
-                    level_info = self._parse_level_info(level_data)
-                    levels.append(level_info)
-                    if level_info.energy.value == 0:
-                        ground_state = level_info
-            
-            # 构建 NuclideProperties
-            # 注意：原始数据单位是 keV，需要除以 1000 转换为 MeV
-            be_per_nucleon = self._parse_value_mev(nuclide_dict.get('bindingEnergy'))
-            
-            props: NuclideProperties = {
-                'Z': Z,
-                'N': N,
-                'A': A,
-                'name': nuclide_dict.get('name', nuclide_name),
-                'symbol': ELEMENT_SYMBOLS.get(Z, f"X{Z}"),
-                'levels': levels,
-                'ground_state': ground_state,
-                
-                # 结合能 (keV -> MeV)
-                'bindingEnergy': self._multiply_value(be_per_nucleon, A),
-                'bindingEnergyPerNucleon': be_per_nucleon,
-                
-                # 分离能 (keV -> MeV)
-                'neutronSeparationEnergy': self._parse_value_mev(nuclide_dict.get('neutronSeparationEnergy')),
-                'protonSeparationEnergy': self._parse_value_mev(nuclide_dict.get('protonSeparationEnergy')),
-                'twoNeutronSeparationEnergy': self._parse_value_mev(nuclide_dict.get('twoNeutronSeparationEnergy')),
-                'twoProtonSeparationEnergy': self._parse_value_mev(nuclide_dict.get('twoProtonSeparationEnergy')),
-                
-                # Q 值 (keV -> MeV)
-                'alpha': self._parse_value_mev(nuclide_dict.get('alpha')),
-                'betaMinus': self._parse_value_mev(nuclide_dict.get('betaMinus')),
-                'electronCapture': self._parse_value_mev(nuclide_dict.get('electronCapture')),
-                
-                # 激发态能量 (keV -> MeV)
-                'firstExcitedStateEnergy': self._parse_value_mev(nuclide_dict.get('firstExcitedStateEnergy')),
-                'firstTwoPlusEnergy': self._parse_value_mev(nuclide_dict.get('firstTwoPlusEnergy')),
-                'firstFourPlusEnergy': self._parse_value_mev(nuclide_dict.get('firstFourPlusEnergy')),
-                'firstThreeMinusEnergy': self._parse_value_mev(nuclide_dict.get('firstThreeMinusEnergy')),
-                
-                # 裂变产额
-                'FY235U': self._parse_value(nuclide_dict.get('FY235U')),
-                'FY238U': self._parse_value(nuclide_dict.get('FY238U')),
-                'FY239Pu': self._parse_value(nuclide_dict.get('FY239Pu')),
-                'FY252Cf': self._parse_value(nuclide_dict.get('FY252Cf')),
-                'cFY235U': self._parse_value(nuclide_dict.get('cFY235U')),
-                'cFY238U': self._parse_value(nuclide_dict.get('cFY238U')),
-                'cFY239Pu': self._parse_value(nuclide_dict.get('cFY239Pu')),
-                'cFY252Cf': self._parse_value(nuclide_dict.get('cFY252Cf')),
-            }
+        返回:
+            NuclideProperties，条目无效时返回 None
+        """
+        if not isinstance(nuclide_dict, dict):
+            return None
+        
+        Z = nuclide_dict.get('z')
+        N = nuclide_dict.get('n')
+        A = nuclide_dict.get('a')
+        
+        if Z is None or N is None:
+            return None
+        
+        # 解析能级信息
+        levels = []
+        ground_state = None
+        raw_levels = nuclide_dict.get('levels')
+        if raw_levels and self._ground_only:
+            # 不显示能级表时只解析基态（最后一个能量为 0 的能级）
+            # 只判断原始能量值，不为被跳过的激发态创建任何对象
+            ground_data = None
+            for level_data in raw_levels:
+                if self._is_zero_energy(level_data.get('energy')):
+                    ground_data = level_data
+            if ground_data is not None:
+                ground_state = self._parse_level_info(ground_data)[0]
+                levels = [ground_state]
+        elif raw_levels:
+            parse_level = self._parse_level_info
+            for level_data in raw_levels:
+                level_info, is_ground = parse_level(level_data)
+                levels.append(level_info)
+                if is_ground:
+                    ground_state = level_info
+        
+        # 构建 NuclideProperties
+        # 注意：原始数据单位是 keV，需要除以 1000 转换为 MeV
+        parse_mev = self._parse_value_mev
+        parse_raw = self._parse_value
+        be_per_nucleon = parse_mev(nuclide_dict.get('bindingEnergy'))
+        
+        props: NuclideProperties = {
+            'Z': Z,
+            'N': N,
+            'A': A,
+            'name': nuclide_dict.get('name', nuclide_name),
+            'symbol': ELEMENT_SYMBOLS.get(Z, f"X{Z}"),
+            'levels': levels,
+            'ground_state': ground_state,
             
-            self._data[(Z, N)] = props
+            # 结合能 (keV -> MeV)
+            'bindingEnergy': self._multiply_value(be_per_nucleon, A),
+            'bindingEnergyPerNucleon': be_per_nucleon,
+        }
+        
+        # 其余数值字段按表解析（指定 fields 时只解析其中的字段）
+        # 许多字段是稀疏的（如裂变产额仅约 28% 的核素有数据）：缺失时既不调用解析函数，
+        # 也不写入键（NuclideProperties 为 total=False，读取方一律使用 .get），记录字典约小三分之一
+        get = nuclide_dict.get
+        for key in self._mev_fields:
+            raw = get(key)
+            if raw is not None:
+                value = parse_mev(raw)
+                if value is not None:
+                    props[key] = value
+        for key in self._raw_fields:
+            raw = get(key)
+            if raw is not None:
+                value = parse_raw(raw)
+                if value is not None:
+                    props[key] = value
+        
+        return props
     
     def _parse_value(self, data) -> Optional[ValueWithUncertainty]:
         """解析带不确定度的值（保持原单位）"""
         if data is None:
             return None
         if isinstance(data, dict):
-            return ValueWithUncertainty(
-                value=data.get('value'),
-                uncertainty=data.get('uncertainty'),
-                unit=data.get('unit', '')
-            )
+            return ValueWithUncertainty(data.get('value'), data.get('uncertainty'), _intern(data.get('unit', '')))
+        if type(data) is float:
+            return ValueWithUncertainty(data, None, '')
         if isinstance(data, (int, float)):
-            return ValueWithUncertainty(value=float(data), unit='')
+            return ValueWithUncertainty(float(data), None, '')
         return None
     
     def _parse_value_mev(self, data) -> Optional[ValueWithUncertainty]:
@@ -227,67 +735,106 @@ class ExperimentalDataSource(DataSource):
         if data is None:
             return None
         if isinstance(data, dict):
+            # JSON 解析器已给出 float，用 type() 判断先走快速路径，再回退到 isinstance
             val = data.get('value')
+            if type(val) is float:
+                val = val / 1000.0
+            elif isinstance(val, (int, float)):
+                val = val / 1000.0
+            else:
+                val = None
             unc = data.get('uncertainty')
-            return ValueWithUncertainty(
-                value=val / 1000.0 if isinstance(val, (int, float)) else None,
-                uncertainty=unc / 1000.0 if isinstance(unc, (int, float)) else None,
-                unit='MeV'
-            )
+            if type(unc) is float:
+                unc = unc / 1000.0
+            elif isinstance(unc, (int, float)):
+                unc = unc / 1000.0
+            else:
+                unc = None
+            return ValueWithUncertainty(val, unc, 'MeV')
         if isinstance(data, (int, float)):
-            return ValueWithUncertainty(value=float(data) / 1000.0, unit='MeV')
+            return ValueWithUncertainty(float(data) / 1000.0, None, 'MeV')
         return None
     
     def _multiply_value(self, val: Optional[ValueWithUncertainty], factor: int) -> Optional[ValueWithUncertainty]:
         """将 ValueWithUncertainty 乘以一个因子"""
         if val is None or val.value is None:
             return None
-        return ValueWithUncertainty(
-            value=val.value * factor,
-            uncertainty=val.uncertainty * factor if val.uncertainty else None,
-            unit=val.unit
-        )
+        # 按位置参数构造（与解析函数一致，比关键字参数快）
+        unc = val.uncertainty
+        return ValueWithUncertainty(val.value * factor, unc * factor if unc else None, val.unit)
     
-    def _parse_level_info(self, level_data: dict) -> LevelInfo:
-        """解析能级信息"""
-        energy = self._parse_value(level_data.get('energy')) or ValueWithUncertainty(value=0)
-        mass_excess = self._parse_value(level_data.get('massExcess')) or ValueWithUncertainty()
-        
-        # 解析衰变模式
-        decay_modes = []
-        if 'decayModesObserved' in level_data and level_data['decayModesObserved']:
-            for dm in level_data['decayModesObserved']:
-                decay_modes.append(DecayModeInfo(
-                    mode=dm.get('mode', ''),
-                    value=dm.get('value'),
-                    uncertainty=dm.get('uncertainty'),
-                    unit=dm.get('unit', '%')
-                ))
-        
-        return LevelInfo(
-            energy=energy,
-            mass_excess=mass_excess,
-            spin_parity=level_data.get('spinParity'),
-            halflife=self._parse_value(level_data.get('halflife')),
-            decay_modes_observed=decay_modes if decay_modes else None
+    def _parse_level_info(self, level_data: dict) -> Tuple[LevelInfo, bool]:
+        """
+        解析能级信息
+        
+        返回:
+            (LevelInfo, 是否为基态)，基态即能量为 0 的能级
+        """
+        energy = self._parse_value(level_data.get('energy')) or _ZERO_ENERGY
+        mass_excess = self._parse_value(level_data.get('massExcess')) or _EMPTY_VALUE
+        
+        halflife = level_data.get('halflife')
+        halflife = _STABLE_HALFLIFE if halflife == _STABLE_RAW else self._parse_value(halflife)
+        
+        # 解析衰变模式: {"observed": [...], "predicted": [...]}
+        decay_modes = level_data.get('decayModes')
+        if decay_modes:
+            observed = self._parse_decay_modes(decay_modes.get('observed'))
+            predicted = self._parse_decay_modes(decay_modes.get('predicted'))
+        else:
+            observed = predicted = None
+        
+        level_info = LevelInfo(
+            energy,
+            mass_excess,
+            _intern(level_data.get('spinParity')),
+            halflife,
+            observed,
+            predicted,
         )
+        return level_info, energy.value == 0
     
-    def get_nuclide(self, Z: int, N: int) -> Optional[NuclideProperties]:
-        self._ensure_loaded()
-        return self._data.get((Z, N))
+    @staticmethod
+    def _is_zero_energy(raw) -> bool:
+        """原始能级能量是否为 0（与 _parse_level_info 的判断一致：缺失或无法解析时按 0 处理）"""
+        if type(raw) is dict:
+            return raw.get('value') == 0
+        if isinstance(raw, (int, float)):
+            return raw == 0
+        return True
     
-    def has_nuclide(self, Z: int, N: int) -> bool:
-        self._ensure_loaded()
-        return (Z, N) in self._data
+    @staticmethod
+    def _parse_decay_modes(modes) -> Optional[List[DecayModeInfo]]:
+        """解析衰变模式列表（分支比单位为 %），无数据时返回 None"""
+        if not modes:
+            return None
+        return [
+            DecayModeInfo(dm.get('value'), dm.get('uncertainty'), _intern(dm.get('unit', '%')), _intern(dm.get('mode', '')))
+            for dm in modes
+        ]
     
-    def list_nuclides(self) -> List[Tuple[int, int]]:
-        self._ensure_loaded()
-        return list(self._data.keys())
+    def _table_file(self) -> Optional[Path]:
+        # 裁剪后的数据缺少部分列，不能读写共享的磁盘缓存
+        return self.data_file if self.fields is None else None
 
 
 # ==================== 理论数据源 ====================
 
-class TheoreticalDataSource(DataSource):
+def _parse_chunk(items: List[Tuple[str, Any]],
+                 fields: Optional[FrozenSet[str]] = None,
+                 encoded: bool = False) -> Tuple[Dict[Tuple[int, int], NuclideProperties], int]:
+    """
+    在子进程中解析一块 JSON 条目（ProcessPoolExecutor 要求顶层函数），返回值同 _parse_items
+    
+    encoded 为 True 时条目值是 _split_json_entries 给出的 JSON 字节串，先在子进程中解码
+    """
+    if encoded:
+        decode = msgspec.json.decode
+        items = [(name, decode(raw)) for name, raw in items]
+    return ExperimentalDataSource(fields=fields)._parse_items(items)
+
+
+class TheoreticalDataSource(IndexedDataSource):
     """
     DFT 理论计算数据源
     
@@ -324,9 +871,7 @@ class TheoreticalDataSource(DataSource):
         else:
             self.data_dir = Path(data_dir)
         
-        # 数据缓存
-        self._data: Dict[Tuple[int, int], NuclideProperties] = {}
-        self._loaded = False
+        super().__init__()
     
     @property
     def name(self) -> str:
@@ -354,49 +899,38 @@ class TheoreticalDataSource(DataSource):
                 available.append(name)
         return available
     
-    def _ensure_loaded(self):
-        """确保数据已加载"""
-        if not self._loaded:
-            self._load_data()
-            self._loaded = True
-    
     def _load_data(self):
         """加载数据文件"""
         filepath = self.data_dir / self._filename
         if not filepath.exists():
             raise FileNotFoundError(f"数据文件不存在: {filepath}")
         
+        # 优先使用磁盘上的解析结果缓存
+        cached = _read_disk_cache(filepath)
+        if cached is not None:
+            self._data = cached
+            return
+        
         with open(filepath, 'r', encoding='utf-8') as f:
             # 跳过表头
             header = f.readline()
             
+            # 热循环中使用局部变量，避免重复的属性查找
+            parse_float = self._parse_float
+            data = self._data
+            
             for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                
+                # split() 会忽略首尾空白，空行得到空列表
                 parts = line.split()
                 if len(parts) < 10:
                     continue
                 
                 try:
-                    symbol = parts[0]
+                    symbol = intern(parts[0])  # 同一元素的所有核素共用一个符号字符串
                     Z = int(parts[1])
                     N = int(parts[2])
                     A = int(parts[3])
                     
-                    # 解析能量值
-                    BE = self._parse_float(parts[4])
-                    Sp = self._parse_float(parts[5])
-                    S2p = self._parse_float(parts[6])
-                    Sn = self._parse_float(parts[7])
-                    S2n = self._parse_float(parts[8])
-                    Q_alpha = self._parse_float(parts[9])
-                    
-                    # 理论数据的结合能是负值，取绝对值
-                    if BE is not None:
-                        BE = abs(BE)
-                    
                     # 构建 NuclideProperties
                     props: NuclideProperties = {
                         'Z': Z,
@@ -404,47 +938,43 @@ class TheoreticalDataSource(DataSource):
                         'A': A,
                         'name': f"{A}{symbol}",
                         'symbol': symbol,
-                        
-                        # 结合能
-                        'bindingEnergy': ValueWithUncertainty(value=BE, unit='MeV') if BE else None,
-                        'bindingEnergyPerNucleon': ValueWithUncertainty(value=BE/A, unit='MeV') if BE and A > 0 else None,
-                        
-                        # 分离能
-                        'neutronSeparationEnergy': ValueWithUncertainty(value=Sn, unit='MeV') if Sn else None,
-                        'protonSeparationEnergy': ValueWithUncertainty(value=Sp, unit='MeV') if Sp else None,
-                        'twoNeutronSeparationEnergy': ValueWithUncertainty(value=S2n, unit='MeV') if S2n else None,
-                        'twoProtonSeparationEnergy': ValueWithUncertainty(value=S2p, unit='MeV') if S2p else None,
-                        
-                        # Q 值
-                        'alpha': ValueWithUncertainty(value=Q_alpha, unit='MeV') if Q_alpha else None,
                     }
                     
-                    self._data[(Z, N)] = props
+                    # 结合能（理论数据为负值，取绝对值）；缺失时不写入
+                    BE = parse_float(parts[4])
+                    if BE is not None:
+                        BE = abs(BE)
+                        props['bindingEnergy'] = ValueWithUncertainty(BE, None, 'MeV')
+                        if A > 0:
+                            props['bindingEnergyPerNucleon'] = ValueWithUncertainty(BE / A, None, 'MeV')
+                    
+                    # 分离能与 Q 值按列表解析（0 与缺失值不写入）
+                    for key, column in _THEORY_COLUMNS:
+                        value = parse_float(parts[column])
+                        if value:
+                            props[key] = ValueWithUncertainty(value, None, 'MeV')
+                    
+                    data[(Z, N)] = props
                     
                 except (ValueError, IndexError):
                     continue
+        
+        _write_disk_cache(filepath, self._data)
     
     def _parse_float(self, value_str: str) -> Optional[float]:
         """解析浮点数"""
+        if value_str == 'No_Data':
+            return None
         value_str = value_str.strip()
-        if value_str == 'No_Data' or value_str == '':
+        if value_str == '':
             return None
         try:
             return float(value_str)
         except ValueError:
             return None
     
-    def get_nuclide(self, Z: int, N: int) -> Optional[NuclideProperties]:
-        self._ensure_loaded()
-        return self._data.get((Z, N))
-    
-    def has_nuclide(self, Z: int, N: int) -> bool:
-        self._ensure_loaded()
-        return (Z, N) in self._data
-    
-    def list_nuclides(self) -> List[Tuple[int, int]]:
-        self._ensure_loaded()
-        return list(self._data.keys())
+    def _table_file(self) -> Optional[Path]:
+        return self.data_dir / self._filename
 
 
 # ==================== 数据源管理器 ====================
@@ -459,6 +989,8 @@ class DataSourceManager:
     def __init__(self, data_dir: Optional[str] = None):
         self.data_dir = Path(data_dir) if data_dir else Path(__file__).parent / 'data'
         self._sources: Dict[str, DataSource] = {}
+        # 调用方给出的原始名称（如 'exp'、'skms'）-> 数据源，重复查询时省去大小写转换与别名判断
+        self._by_name: Dict[str, DataSource] = {}
         
         # 自动注册实验数据源
         self._register_experimental_source()
@@ -466,7 +998,7 @@ class DataSourceManager:
     def _register_experimental_source(self):
         """注册实验数据源"""
         try:
-            exp_source = ExperimentalDataSource(str(self.data_dir / 'nndc_nudat_data_export.json'))
+            exp_source = ExperimentalDataSource(str(self.data_dir / _EXPERIMENT_FILENAME))
             self._sources['experiment'] = exp_source
         except FileNotFoundError:
             pass
@@ -481,6 +1013,14 @@ class DataSourceManager:
         返回:
             DataSource 实例
         """
+        # 每次创建 Nuclide 都会调用：先按原始名称查找
+        source = self._by_name.get(name)
+        if source is None:
+            source = self._by_name[name] = self._resolve_source(name)
+        return source
+    
+    def _resolve_source(self, name: str) -> DataSource:
+        """按名称（不区分大小写，含实验数据别名）查找或创建数据源"""
         name_lower = name.lower()
         
         # 检查是否已缓存
@@ -490,10 +1030,10 @@ class DataSourceManager:
             return self._sources[name.upper()]
         
         # 实验数据
-        if name_lower in ('experiment', 'exp', 'nndc'):
+        if name_lower in _EXPERIMENT_ALIASES:
             if 'experiment' not in self._sources:
                 self._sources['experiment'] = ExperimentalDataSource(
-                    str(self.data_dir / 'nndc_nudat_data_export.json')
+                    str(self.data_dir / _EXPERIMENT_FILENAME)
                 )
             return self._sources['experiment']
         
@@ -21,7 +21,26 @@ from .data_source import (
     DataSource, DataSourceManager, get_data_source_manager,
     ExperimentalDataSource, TheoreticalDataSource, list_sources
 )
-from .nuclide_data import NuclideProperties, ValueWithUncertainty, ELEMENT_SYMBOLS
+from .nuclide_data import NuclideProperties, ValueWithUncertainty, ELEMENT_SYMBOLS, SYMBOL_TO_Z, MAGIC_NUMBERS
+
+
+# 核素字符串：元素符号[-]?质量数
+_NUCLIDE_PATTERN = re.compile(r'^([A-Za-z]+)[-]?(\d+)$')
+
+# 幻数 -> 标记文本（一次字典查找同时完成判断与格式化）
+_MAGIC_Z_LABELS: Dict[int, str] = {m: f"Z={m}" for m in MAGIC_NUMBERS}
+_MAGIC_N_LABELS: Dict[int, str] = {m: f"N={m}" for m in MAGIC_NUMBERS}
+
+
+def format_halflife(halflife: Optional[ValueWithUncertainty]) -> Optional[str]:
+    """将半衰期格式化为字符串，如 "2.6 ms" 或 "STABLE" """
+    if not halflife:
+        return None
+    val = halflife.value
+    unit = halflife.unit
+    if val == 'STABLE':
+        return 'STABLE'
+    return f"{val} {unit}" if unit else str(val)
 
 
 class Nuclide:
@@ -32,7 +51,7 @@ class Nuclide:
     支持实验数据和理论数据
     
     属性列表:
-        基本信息: Z, N, A, name, symbol, exists, source
+        基本信息: Z, N, A, name, symbol, magic_numbers, exists, source
         结合能: BE (MeV), BE_A (MeV/核子)
         分离能: Sn, Sp, S2n, S2p (MeV)
         Q值: Q_alpha, Q_beta (MeV)
@@ -40,6 +59,9 @@ class Nuclide:
         衰变: halflife, spin_parity, is_stable, decay_modes
     """
     
+    # 批量查询会为每个核素创建一个对象：固定属性，省去实例字典
+    __slots__ = ('_Z', '_N', '_source_name', '_data')
+    
     # 类级别缓存数据源管理器
     _manager: Optional[DataSourceManager] = None
     
@@ -89,20 +111,12 @@ class Nuclide:
         返回:
             (Z, N) 元组。如果解析失败，返回 (None, None)
         """
-        s = s.strip()
-        # 匹配 元素符号[-]?质量数
-        match = re.match(r'^([A-Za-z]+)[-]?(\d+)$', s)
+        match = _NUCLIDE_PATTERN.match(s.strip())
         if match:
-            element = match.group(1).capitalize()
             A = int(match.group(2))
-            
+
             # 查找质子数
-            Z = None
-            for atomic_num, sym in ELEMENT_SYMBOLS.items():
-                if sym.lower() == element.lower():
-                    Z = atomic_num
-                    break
-            
+            Z = SYMBOL_TO_Z.get(match.group(1).lower())
             if Z is not None:
                 N = A - Z
                 if N >= 0:
@@ -157,6 +171,15 @@ class Nuclide:
         """元素符号"""
         return ELEMENT_SYMBOLS.get(self._Z, f"X{self._Z}")
     
+    @property
+    def magic_numbers(self) -> List[str]:
+        """幻数标记，如 ['Z=28', 'N=28']；非幻数核返回空列表"""
+        z_label = _MAGIC_Z_LABELS.get(self._Z)
+        n_label = _MAGIC_N_LABELS.get(self._N)
+        if z_label is None:
+            return [n_label] if n_label else []
+        return [z_label, n_label] if n_label else [z_label]
+    
     @property
     def exists(self) -> bool:
         """核素是否存在于数据库中"""
@@ -253,13 +276,7 @@ class Nuclide:
         if self._data is None:
             return None
         gs = self._data.get('ground_state')
-        if gs and gs.halflife:
-            val = gs.halflife.value
-            unit = gs.halflife.unit
-            if val == 'STABLE':
-                return 'STABLE'
-            return f"{val} {unit}" if unit else str(val)
-        return None
+        return format_halflife(gs.halflife) if gs else None
     
     @property
     def spin_parity(self) -> Optional[str]:
@@ -289,15 +306,19 @@ class Nuclide:
     
     def _get_value(self, key: str) -> Optional[float]:
         """从数据中获取数值"""
-        if self._data is None:
+        data = self._data
+        if data is None:
             return None
         
-        obj = self._data.get(key)
+        obj = data.get(key)
         if obj is None:
             return None
         
         if isinstance(obj, ValueWithUncertainty):
-            return obj.value if isinstance(obj.value, (int, float)) else None
+            value = obj.value
+            if type(value) is float:  # 解析器给出的数值几乎都是 float
+                return value
+            return value if isinstance(value, (int, float)) else None
         if isinstance(obj, (int, float)):
             return float(obj)
         return None
@@ -322,6 +343,7 @@ class Nuclide:
             'A          - 质量数',
             'name       - 核素名称 (如 Fe-56)',
             'symbol     - 元素符号',
+            'magic_numbers - 幻数标记 (如 Z=28, N=28)',
             'exists     - 是否存在于数据库',
             'source     - 数据源名称',
             '',
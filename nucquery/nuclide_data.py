@@ -1,14 +1,22 @@
-from typing import TypedDict, Dict, List, Optional, Union, Any
+import sys
+from typing import TypedDict, Dict, List, Optional, Tuple, Union, Any
 from enum import Enum
 from dataclasses import dataclass
 
-@dataclass
+# 每个核素有几十个数值/能级对象，使用 __slots__ 省去实例字典（需要 Python 3.10+）
+_DATACLASS_OPTIONS: Dict[str, Any] = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_DATACLASS_OPTIONS)
 class ValueWithUncertainty:
     """带不确定度的数值"""
     value: Union[float, str, None] = None
     uncertainty: Optional[float] = None
     unit: str = ""
 
+    def __reduce__(self):
+        """按位置参数序列化（比默认的属性字典更紧凑，反序列化更快）"""
+        return (self.__class__, (self.value, self.uncertainty, self.unit))
+
     def __mul__(self, other: int) -> 'ValueWithUncertainty':
         """乘法运算"""
         new_value = self.value * other if isinstance(self.value, float) else None
@@ -21,17 +29,20 @@ class ValueWithUncertainty:
         new_uncertainty = self.uncertainty / other if isinstance(self.uncertainty, float) else None
         return ValueWithUncertainty(new_value, new_uncertainty, self.unit)
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class DecayModeInfo(ValueWithUncertainty):
     """衰变模式信息"""
     mode: str = ""
 
+    def __reduce__(self):
+        return (self.__class__, (self.value, self.uncertainty, self.unit, self.mode))
+
 @dataclass
 class HalfLifeInfo(ValueWithUncertainty):
     """半衰期信息"""
     value = "STABLE"  # 可以是数值或"STABLE"
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class LevelInfo:
     """能级信息"""
     energy: ValueWithUncertainty
@@ -136,9 +147,36 @@ ELEMENT_SYMBOLS: Dict[int, str] = {
     118: 'Og'
 }
 
+# 元素符号反查 (小写 symbol -> Z)，解析 "fe56" 等字符串时一次字典查找
+SYMBOL_TO_Z: Dict[str, int] = {sym.lower(): z for z, sym in ELEMENT_SYMBOLS.items()}
+
 # 幻数
 MAGIC_NUMBERS: List[int] = [2, 8, 20, 28, 50, 82, 126]
 
+# 衰变模式 -> 子核相对母核的 (ΔZ, ΔN)
+# NNDC 数据中同一模式有 ASCII（如 B-、EC+B+）与希腊字母（如 β⁻、ε+β+）两种写法；
+# 裂变 (SF) 与重离子发射不在表中，衰变链在此终止
+DECAY_MODE_DELTAS: Dict[str, Tuple[int, int]] = {
+    'A': (-2, -2),
+    'B-': (1, -1), 'β⁻': (1, -1),
+    '2B-': (2, -2),
+    'B-N': (1, -2), 'β⁻n': (1, -2),
+    'B-2N': (1, -3), 'β⁻2n': (1, -3),
+    'B-3N': (1, -4),
+    'B-4N': (1, -5),
+    'B-A': (-1, -3),
+    'EC': (-1, 1), 'EC+B+': (-1, 1), 'ε': (-1, 1), 'ε+β+': (-1, 1),
+    'ECP': (-2, 1), 'εp': (-2, 1),
+    'EC2P': (-3, 1), 'ε2p': (-3, 1),
+    'EC3P': (-4, 1), 'ε3p': (-4, 1),
+    'ECA': (-3, -1), 'εɑ': (-3, -1),
+    'P': (-1, 0), 'p': (-1, 0),
+    '2P': (-2, 0), '2p': (-2, 0),
+    '3P': (-3, 0),
+    'N': (0, -1),
+    '2N': (0, -2),
+}
+
 # 半衰期单位转换
 HALF_LIFE_UNITS: Dict[str, float] = {
     'ys': 1e-24,  # 幺秒
@@ -4,9 +4,43 @@
 支持实验数据和理论计算数据的命令行查询
 """
 
-from typing import Optional, Tuple, List
-from .nuclide import Nuclide
-from .data_source import get_data_source_manager, list_sources
+import csv
+import io
+from itertools import islice
+from operator import attrgetter
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple, List
+from .nuclide import Nuclide, format_halflife
+from .nuclide_data import NuclideProperties, ELEMENT_SYMBOLS, DECAY_MODE_DELTAS
+from .nuclide_table import SUMMARY_FIELDS
+from .data_source import DataSource, get_data_source_manager, list_sources
+from .config import BATCH_QUERY_CSV_FIELDS
+
+
+# CSV 导出：每批写入的行数与文件缓冲区大小
+CSV_CHUNK_ROWS = 1000
+CSV_BUFFER_SIZE = 1 << 20
+
+# CSV 导出：浮点数列对应的 Nuclide 属性（binding_energy ... two_proton_separation_energy）及其格式
+_get_csv_floats = attrgetter('BE', 'BE_A', 'Sn', 'Sp', 'S2n', 'S2p')
+_fmt_float = "{:.3f}".format
+
+# 衰变链最大步数：实际最长的衰变链只有十几步，此上限仅用于防御异常数据
+DECAY_PATH_MAX_STEPS = 350
+
+
+def _dominant_decay_delta(props: NuclideProperties) -> Optional[Tuple[int, int]]:
+    """
+    基态分支比最大的衰变模式对应的 (ΔZ, ΔN)
+    
+    返回:
+        稳定核、无衰变数据或模式不在 DECAY_MODE_DELTAS 中时返回 None
+    """
+    ground_state = props.get('ground_state')
+    modes = ground_state.decay_modes_observed if ground_state else None
+    if not modes:
+        return None
+    dominant = max(modes, key=lambda dm: dm.value if isinstance(dm.value, (int, float)) else 0)
+    return DECAY_MODE_DELTAS.get(dominant.mode)
 
 
 def parse_nuclide_string(nuclide_str: str) -> tuple:
@@ -28,6 +62,8 @@ class NuclideQuery:
             source: 数据源名称 ('experiment', 'SKMS', 'UNEDF1', 等)
         """
         self._source_name = source
+        self._source_obj: Optional[DataSource] = None
+        self._decay_successors: Optional[Dict[Tuple[int, int], Tuple[int, int]]] = None
     
     @property
     def source_name(self) -> str:
@@ -37,6 +73,14 @@ class NuclideQuery:
     def set_source(self, source: str):
         """切换数据源"""
         self._source_name = source
+        self._source_obj = None
+        self._decay_successors = None
+    
+    def _get_source(self) -> DataSource:
+        """获取当前数据源对象（缓存，避免每次查询重复解析数据源名称）"""
+        if self._source_obj is None:
+            self._source_obj = get_data_source_manager().get_source(self._source_name)
+        return self._source_obj
     
     def list_sources(self) -> List[str]:
         """列出所有可用数据源"""
@@ -53,39 +97,112 @@ class NuclideQuery:
         返回:
             Nuclide 对象，如果未找到则返回None
         """
-        nuc = Nuclide(Z, N, source=self._source_name)
-        return nuc if nuc.exists else None
+        try:
+            data = self._get_source().get_nuclide(Z, N)
+        except ValueError:
+            return None
+        return Nuclide(Z, N, source=self._source_name, data=data) if data else None
 
-    def query_range(self, Z_min: int, Z_max: int, N_min: int, N_max: int) -> List[Nuclide]:
+    def _scan(self, props_iter: Iterable[Optional[NuclideProperties]]) -> Iterator[Nuclide]:
         """
-        查询指定范围内的所有核素
+        批量查询的公共驱动：将数据源返回的数据包装为 Nuclide 对象
+        
+        参数:
+            props_iter: 数据源返回的 NuclideProperties 序列（None 表示不存在，将被跳过）
+            
+        返回:
+            Nuclide 对象生成器
+        """
+        source = self._source_name
+        for props in props_iter:
+            if props is None:
+                continue
+            # 创建 Nuclide 对象 (传入预加载的数据)
+            yield Nuclide(props['Z'], props['N'], source=source, data=props)
+
+    def iter_range(self, Z_min: int, Z_max: int, N_min: int, N_max: int) -> Iterator[Nuclide]:
+        """
+        逐个生成指定范围内的核素（按 Z 然后 N 排序）
         
         参数:
             Z_min, Z_max: 质子数范围
             N_min, N_max: 中子数范围
             
         返回:
-            Nuclide 对象列表
+            Nuclide 对象生成器
+        """
+        src_obj = self._get_source()
+        
+        # 逐个 Z 截取同位素链（按 N 有序，二分查找定位范围），只访问存在的核素，
+        # 不枚举空网格位置、不排序
+        Z_values: Iterable[int] = range(max(Z_min, 0), Z_max + 1)
+        known = src_obj.known_pairs()
+        if len(Z_values) > len(known):
+            # Z 范围远大于数据本身（如不设上限）：只取数据中出现的 Z
+            Z_values = sorted({Z for Z, _ in known if Z_min <= Z <= Z_max})
+        get_isotopes = src_obj.get_isotopes
+        for Z in Z_values:
+            yield from self._scan(get_isotopes(Z, N_min, N_max))
+    
+    def iter_isotopes(self, Z: int, N_min: Optional[int] = None, N_max: Optional[int] = None) -> Iterator[Nuclide]:
+        """
+        逐个生成指定元素的同位素（按 N 排序）
+        
+        参数:
+            Z: 质子数
+            N_min, N_max: 中子数范围（可选）
+            
+        返回:
+            Nuclide 对象生成器
         """
-        manager = get_data_source_manager()
-        src_obj = manager.get_source(self._source_name)
+        src_obj = self._get_source()
         
-        results = []
+        # 从数据源获取真实的同位素数据列表
+        yield from self._scan(src_obj.get_isotopes(Z, N_min, N_max))
+    
+    def iter_isotones(self, N: int, Z_min: Optional[int] = None, Z_max: Optional[int] = None) -> Iterator[Nuclide]:
+        """
+        逐个生成指定中子数的同中子素（按 Z 排序）
+        
+        参数:
+            N: 中子数
+            Z_min, Z_max: 质子数范围（可选）
+            
+        返回:
+            Nuclide 对象生成器
+        """
+        src_obj = self._get_source()
         
-        # 获取所有存在的核素列表，避免无效查询
-        all_nuclides = src_obj.list_nuclides()
+        # 从数据源获取真实的同中子素数据列表
+        yield from self._scan(src_obj.get_isotones(N, Z_min, Z_max))
+    
+    def iter_from_list(self, nuclide_list: List[Tuple[int, int]]) -> Iterator[Nuclide]:
+        """
+        逐个生成给定核素列表中存在的核素（保持输入顺序）
         
-        for Z, N in all_nuclides:
-            if Z_min <= Z <= Z_max and N_min <= N <= N_max:
-                # 获取数据并创建对象
-                data = src_obj.get_nuclide(Z, N)
-                nuc = Nuclide(Z, N, source=self._source_name, data=data)
-                results.append(nuc)
+        参数:
+            nuclide_list: [(Z1, N1), (Z2, N2), ...] 的列表
+            
+        返回:
+            Nuclide 对象生成器
+        """
+        src_obj = self._get_source()
         
-        # 按 Z 然后 N 排序
-        results.sort(key=lambda x: (x.Z, x.N))
+        # 批量获取数据，跳过不存在的核素
+        yield from self._scan(src_obj.get_nuclides(nuclide_list))
+
+    def query_range(self, Z_min: int, Z_max: int, N_min: int, N_max: int) -> List[Nuclide]:
+        """
+        查询指定范围内的所有核素
         
-        return results
+        参数:
+            Z_min, Z_max: 质子数范围
+            N_min, N_max: 中子数范围
+            
+        返回:
+            Nuclide 对象列表
+        """
+        return list(self.iter_range(Z_min, Z_max, N_min, N_max))
     
     def query_isotopes(self, Z: int, N_min: Optional[int] = None, N_max: Optional[int] = None) -> List[Nuclide]:
         """
@@ -98,26 +215,7 @@ class NuclideQuery:
         返回:
             Nuclide 对象列表
         """
-        manager = get_data_source_manager()
-        src_obj = manager.get_source(self._source_name)
-        
-        # 从数据源获取真实的同位素数据列表
-        props_list = src_obj.get_isotopes(Z)
-        
-        nuclides = []
-        for props in props_list:
-            N = props['N']
-            # 如果指定了范围，进行过滤
-            if N_min is not None and N < N_min:
-                continue
-            if N_max is not None and N > N_max:
-                continue
-            
-            # 创建 Nuclide 对象 (传入预加载的数据)
-            nuc = Nuclide(Z, N, source=self._source_name, data=props)
-            nuclides.append(nuc)
-            
-        return nuclides
+        return list(self.iter_isotopes(Z, N_min, N_max))
     
     def query_isotones(self, N: int, Z_min: Optional[int] = None, Z_max: Optional[int] = None) -> List[Nuclide]:
         """
@@ -130,25 +228,7 @@ class NuclideQuery:
         返回:
             Nuclide 对象列表
         """
-        manager = get_data_source_manager()
-        src_obj = manager.get_source(self._source_name)
-        
-        # 从数据源获取真实的同中子素数据列表
-        props_list = src_obj.get_isotones(N)
-        
-        nuclides = []
-        for props in props_list:
-            Z = props['Z']
-            # 如果指定了范围，进行过滤
-            if Z_min is not None and Z < Z_min:
-                continue
-            if Z_max is not None and Z > Z_max:
-                continue
-                
-            nuc = Nuclide(Z, N, source=self._source_name, data=props)
-            nuclides.append(nuc)
-            
-        return nuclides
+        return list(self.iter_isotones(N, Z_min, Z_max))
     
     def query_from_list(self, nuclide_list: List[Tuple[int, int]]) -> List[Nuclide]:
         """
@@ -160,11 +240,250 @@ class NuclideQuery:
         返回:
             Nuclide 对象列表
         """
-        results = []
+        return list(self.iter_from_list(nuclide_list))
+    
+    def get_columns(self, nuclide_list: List[Tuple[int, int]],
+                    fields: Tuple[str, ...] = SUMMARY_FIELDS,
+                    uncertainties: bool = False) -> Dict[str, list]:
+        """
+        以列的形式批量读取核素标量数据
+        
+        参数:
+            nuclide_list: [(Z1, N1), (Z2, N2), ...] 的列表
+            fields: 需要读取的字段（默认 SUMMARY_FIELDS，即结合能与分离能；
+                    可选范围见 SCALAR_FIELDS）
+            uncertainties: 是否同时返回不确定度列（键名为 "字段名_unc"）
+            
+        返回:
+            {'Z': [...], 'N': [...], 字段名: [...]} 字典，缺失值为 NaN，
+            不存在的核素被跳过
+        """
+        table = self._get_source().get_table()
+        return self._read_columns(table, table.rows(nuclide_list), fields, uncertainties)
+    
+    def get_isotope_columns(self, Z: int, fields: Tuple[str, ...] = SUMMARY_FIELDS,
+                            uncertainties: bool = False) -> Dict[str, list]:
+        """
+        以列的形式读取整条同位素链（按 N 排序）
+        
+        同一 Z 的核素在列式存储中占连续的行，每列整段切片读取，不逐个查找核素
+        
+        参数:
+            Z: 质子数
+            fields, uncertainties: 同 get_columns
+            
+        返回:
+            同 get_columns；Z 不存在时各列为空
+        """
+        table = self._get_source().get_table()
+        return self._read_columns(table, table.isotope_rows(Z), fields, uncertainties)
+    
+    @staticmethod
+    def _read_columns(table, rows, fields: Tuple[str, ...], uncertainties: bool) -> Dict[str, list]:
+        """按行号从列式存储读取 Z/N 列与各字段列"""
+        columns = {
+            'Z': [table.Z[row] for row in rows],
+            'N': [table.N[row] for row in rows],
+        }
+        for field in fields:
+            NuclideQuery._check_field(table, field)
+            columns[field] = table.column(field, rows)
+            if uncertainties:
+                columns[f"{field}_unc"] = table.uncertainty(field, rows)
+        return columns
+    
+    @staticmethod
+    def _check_field(table, field: str):
+        """检查字段是否在列式存储中，否则抛出 ValueError 并列出可用字段"""
+        if field not in table.columns:
+            raise ValueError(f"未知字段: {field}，可用: {list(table.columns)}")
+    
+    def filter_by_value(self, field: str, lo: Optional[float] = None,
+                        hi: Optional[float] = None) -> List[Tuple[int, int]]:
+        """
+        在当前数据源的全部核素中按数值范围筛选
+        
+        参数:
+            field: 字段名（见 SCALAR_FIELDS，如 'neutronSeparationEnergy'）
+            lo, hi: 数值上下限 (MeV)，None 表示不限；无该数据的核素被排除
+            
+        返回:
+            按 (Z, N) 排序的核素列表，可直接传给 query_from_list/export_csv
+            
+        示例:
+            >>> query.filter_by_value('neutronSeparationEnergy', hi=1.0)  # 近中子滴线核素
+        """
+        table = self._get_source().get_table()
+        self._check_field(table, field)
+        pairs = table.pairs
+        return [pairs[row] for row in table.select(field, lo, hi)]
+    
+    def summarize(self, field: str,
+                  nuclide_list: Optional[List[Tuple[int, int]]] = None) -> Optional[Dict[str, Any]]:
+        """
+        统计某一字段的数值分布（单次遍历列式存储，不创建 Nuclide 对象）
+        
+        参数:
+            field: 字段名（见 SCALAR_FIELDS）
+            nuclide_list: 参与统计的核素，None 表示当前数据源的全部核素
+            
+        返回:
+            {'count', 'min', 'max', 'mean', 'argmax'} 字典，argmax 为最大值所在核素 (Z, N)；
+            没有有效数值时返回 None
+            
+        示例:
+            >>> query.summarize('bindingEnergyPerNucleon')['argmax']  # 比结合能最大的核素
+        """
+        table = self._get_source().get_table()
+        self._check_field(table, field)
+        rows = None if nuclide_list is None else table.rows(nuclide_list)
+        result = table.stats(field, rows)
+        if result is None:
+            return None
+        count, lo, hi, total, top_row = result
+        return {'count': count, 'min': lo, 'max': hi, 'mean': total / count,
+                'argmax': table.pairs[top_row]}
+    
+    def _get_decay_successors(self) -> Dict[Tuple[int, int], Tuple[int, int]]:
+        """
+        衰变后继表: (Z, N) -> 主要衰变模式的子核 (Z, N)
         
-        for Z, N in nuclide_list:
-            nuc = Nuclide(Z, N, source=self._source_name)
-            if nuc.exists:
-                results.append(nuc)
+        首次调用时对整个数据源构建一次，之后每一步衰变只需一次字典查找；
+        只收录数据中存在的子核，表中没有的核素即为衰变链终点
+        """
+        if self._decay_successors is None:
+            src_obj = self._get_source()
+            known = src_obj.known_pairs()
+            pairs = list(known)
+            successors = {}
+            for (Z, N), props in zip(pairs, src_obj.get_nuclides(pairs)):
+                delta = _dominant_decay_delta(props) if props else None
+                if delta is not None:
+                    daughter = (Z + delta[0], N + delta[1])
+                    if daughter in known:
+                        successors[(Z, N)] = daughter
+            self._decay_successors = successors
+        return self._decay_successors
+    
+    def get_decay_path(self, Z: int, N: int, max_steps: int = DECAY_PATH_MAX_STEPS) -> List[Nuclide]:
+        """
+        沿基态的主要衰变模式追踪衰变链
         
-        return results
\ No newline at end of file
+        参数:
+            Z: 起始核素质子数
+            N: 起始核素中子数
+            max_steps: 最大步数
+            
+        返回:
+            从起始核素开始的 Nuclide 列表；遇到稳定核、未知衰变模式、
+            数据中不存在的子核或重复访问的核素（数据异常形成环）时停止
+        """
+        if (Z, N) not in self._get_source().known_pairs():
+            return []
+        successors = self._get_decay_successors()
+        pairs: List[Tuple[int, int]] = []
+        visited = set()
+        current = (Z, N)
+        # 后继表中的子核均存在于数据中，行走时无需再检查；最后才为链上的核素创建 Nuclide 对象
+        while current is not None and current not in visited and len(pairs) <= max_steps:
+            visited.add(current)
+            pairs.append(current)
+            current = successors.get(current)
+        return self.query_from_list(pairs)
+    
+    @staticmethod
+    def _csv_row(nuc: Nuclide) -> tuple:
+        """将 Nuclide 对象转换为一行 CSV 数据（字段顺序同 BATCH_QUERY_CSV_FIELDS）"""
+        decay_modes = nuc.decay_modes
+        return (
+            nuc.Z, nuc.N, nuc.A, nuc.symbol, nuc.name,
+            # 浮点数列一次性取值并统一格式化
+            *[_fmt_float(v) if v is not None else 'N/A' for v in _get_csv_floats(nuc)],
+            '/'.join(decay_modes) if decay_modes else None,
+            nuc.halflife,
+            nuc.spin_parity,
+        )
+    
+    def iter_csv_rows(self, nuclide_list: List[Tuple[int, int]]) -> Iterator[tuple]:
+        """
+        直接从列式存储生成 CSV 行，不创建 Nuclide 对象
+        
+        参数:
+            nuclide_list: [(Z1, N1), (Z2, N2), ...] 的列表，不存在的核素被跳过
+            
+        返回:
+            CSV 行元组生成器（字段顺序同 BATCH_QUERY_CSV_FIELDS）
+        """
+        src_obj = self._get_source()
+        table = src_obj.get_table()
+        rows = table.rows(nuclide_list)
+        pairs = [table.pairs[row] for row in rows]
+        
+        # 数值列整列格式化，NaN 表示缺失
+        formatted = [
+            [_fmt_float(v) if v == v else 'N/A' for v in table.column(field, rows)]
+            for field in SUMMARY_FIELDS
+        ]
+        
+        for (Z, N), floats, props in zip(pairs, zip(*formatted), src_obj.get_nuclides(pairs)):
+            A = Z + N
+            symbol = ELEMENT_SYMBOLS.get(Z, f"X{Z}")
+            gs = props.get('ground_state')
+            decay_modes = gs.decay_modes_observed if gs else None
+            yield (
+                Z, N, A, symbol, f"{symbol}-{A}",
+                *floats,
+                '/'.join(dm.mode for dm in decay_modes) if decay_modes else None,
+                format_halflife(gs.halflife) if gs else None,
+                gs.spin_parity if gs else None,
+            )
+    
+    def _write_csv(self, rows: Iterable[tuple], filename: str) -> int:
+        """按块将 CSV 行写入文件，返回写入的行数"""
+        count = 0
+        # 二进制文件 + 1 MiB 缓冲区，文本层不逐次透写，减少编码与系统调用次数
+        raw = io.FileIO(filename, 'w')
+        buffered = io.BufferedWriter(raw, buffer_size=CSV_BUFFER_SIZE)
+        with io.TextIOWrapper(buffered, encoding='utf-8', newline='', write_through=False) as csvfile:
+            writer = csv.writer(csvfile)
+            writer.writerow(BATCH_QUERY_CSV_FIELDS)
+            
+            writerows = writer.writerows
+            
+            # 按块批量写入，减少逐行写入的开销；行由迭代器驱动，循环内无属性查找
+            rows = iter(rows)
+            while True:
+                chunk = list(islice(rows, CSV_CHUNK_ROWS))
+                if not chunk:
+                    break
+                writerows(chunk)
+                count += len(chunk)
+        
+        return count
+    
+    def save_to_csv(self, nuclides: Iterable[Nuclide], filename: str) -> int:
+        """
+        将核素数据导出为 CSV 文件
+        
+        参数:
+            nuclides: Nuclide 对象的列表或生成器（如 iter_range 的返回值）
+            filename: 输出文件路径
+            
+        返回:
+            写入的核素行数
+        """
+        return self._write_csv(map(self._csv_row, nuclides), filename)
+    
+    def export_csv(self, nuclide_list: List[Tuple[int, int]], filename: str) -> int:
+        """
+        按 (Z, N) 列表将当前数据源的核素数据导出为 CSV 文件
+        与 save_to_csv 输出相同，但直接读取列式存储，不创建 Nuclide 对象
+        
+        参数:
+            nuclide_list: [(Z1, N1), (Z2, N2), ...] 的列表
+            filename: 输出文件路径
+            
+        返回:
+            写入的核素行数
+        """
+        return self._write_csv(self.iter_csv_rows(nuclide_list), filename)
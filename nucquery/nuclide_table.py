@@ -0,0 +1,330 @@
+#!/usr/bin/env python3
+"""
+核素标量数据的列式存储 (Structure of Arrays)
+
+将每个核素的标量字段（结合能、分离能、Q 值、激发能）的数值与不确定度
+分别按列存放在连续的 array 中，缺失值用 NaN 表示，供批量查询/导出
+直接按行号读取，无需逐个访问 NuclideProperties 字典
+"""
+
+import mmap
+import pickle
+import struct
+from array import array
+from bisect import bisect_left
+from math import inf, nan
+from typing import BinaryIO, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from .nuclide_data import NuclideProperties, ValueWithUncertainty
+
+
+# 列式存储的标量字段（NuclideProperties 键名）
+SUMMARY_FIELDS: Tuple[str, ...] = (
+    'bindingEnergy',
+    'bindingEnergyPerNucleon',
+    'neutronSeparationEnergy',
+    'protonSeparationEnergy',
+    'twoNeutronSeparationEnergy',
+    'twoProtonSeparationEnergy',
+)
+
+# 列式存储的全部标量字段（单位均为 MeV）
+SCALAR_FIELDS: Tuple[str, ...] = SUMMARY_FIELDS + (
+    'alpha',
+    'betaMinus',
+    'electronCapture',
+    'firstExcitedStateEnergy',
+    'firstTwoPlusEnergy',
+    'firstFourPlusEnergy',
+    'firstThreeMinusEnergy',
+)
+
+
+# 质子数/中子数列（无符号 16 位）
+INDEX_TYPECODE = 'H'
+
+# 数值列与不确定度列均为双精度：单精度无法精确还原原始十进制数值
+# （如 0.0009854 会读回 0.0009854001），而不确定度列只占表的一半，节省有限
+VALUE_TYPECODE = 'd'
+UNCERTAINTY_TYPECODE = 'd'
+
+# 二进制文件格式版本（布局或字段含义改变时递增）
+# 2: 定长文件头中包含数据版本与列类型，校验通过后才反序列化其余头部
+TABLE_FORMAT_VERSION = 2
+
+# 文件开头的定长头部（小端）：魔数、格式版本、数值/不确定度列类型、
+# 数据版本、数据文件修改时间 (ns)、数据文件大小、其后 pickle 头部的长度；
+# pickle 头部之后按 8 字节对齐存放各列
+_HEADER = struct.Struct('<8sI2sIqQQ')
+_MAGIC = b'NUCQTBL\0'
+_TYPECODES = (VALUE_TYPECODE + UNCERTAINTY_TYPECODE).encode('ascii')
+
+
+def _pack_header(stamp: Tuple[int, int, int], header_len: int) -> bytes:
+    """生成定长文件头"""
+    return _HEADER.pack(_MAGIC, TABLE_FORMAT_VERSION, _TYPECODES, *stamp, header_len)
+
+
+def _read_layout(mm: mmap.mmap, stamp: Tuple[int, int, int],
+                 fields: Tuple[str, ...]) -> Optional[Tuple[int, List[Tuple[int, int]]]]:
+    """
+    校验文件头并读取核素列表
+
+    先按定长头部校验格式版本、列类型与数据指纹，通过后才反序列化 pickle 头部
+
+    返回:
+        (第一列之前的偏移, pairs)；文件不匹配、损坏或被截断时返回 None
+    """
+    if len(mm) < _HEADER.size:
+        return None
+    header_len = _HEADER.unpack_from(mm, 0)[-1]
+    if mm[:_HEADER.size] != _pack_header(stamp, header_len):
+        return None
+    offset = _HEADER.size + header_len
+    try:
+        file_fields, pairs = pickle.loads(mm[_HEADER.size:offset])
+    except Exception:
+        return None
+    if tuple(file_fields) != fields:
+        return None
+
+    # 文件被截断时最后几列长度不足
+    end = offset
+    for typecode in (VALUE_TYPECODE, UNCERTAINTY_TYPECODE):
+        size = len(pairs) * array(typecode).itemsize
+        for _ in fields:
+            end += -end % 8 + size
+    if end > len(mm):
+        return None
+    return offset, pairs
+
+
+def _value_or_nan(obj) -> float:
+    """取出 ValueWithUncertainty 的数值，缺失时返回 NaN"""
+    if isinstance(obj, ValueWithUncertainty):
+        value = obj.value
+        if type(value) is float:  # 解析器已换算为 MeV 浮点数，绝大多数走这里
+            return value
+        if isinstance(value, (int, float)):
+            return float(value)
+    return nan
+
+
+def _uncertainty_or_nan(obj) -> float:
+    """取出 ValueWithUncertainty 的（对称）不确定度，缺失或非对称时返回 NaN"""
+    if isinstance(obj, ValueWithUncertainty):
+        uncertainty = obj.uncertainty
+        if type(uncertainty) is float:
+            return uncertainty
+        if isinstance(uncertainty, (int, float)):
+            return float(uncertainty)
+    return nan
+
+
+class NuclideTable:
+    """
+    核素标量数据列表
+
+    属性:
+        pairs: 按 (Z, N) 排序的核素列表，下标即行号
+        row_of: (Z, N) -> 行号
+        Z, N: array('H') 质子数/中子数列（由 pairs 导出，不写入文件）
+        columns: 字段名 -> array('d') 数值列（由 load 加载时为内存映射的 memoryview）
+        uncertainties: 字段名 -> array('d') 不确定度列
+    """
+
+    def __init__(self, data: Mapping[Tuple[int, int], NuclideProperties],
+                 fields: Tuple[str, ...] = SCALAR_FIELDS):
+        """
+        由 {(Z, N): NuclideProperties} 构建列表
+
+        参数:
+            data: 数据源中的核素数据
+            fields: 需要按列存储的字段
+        """
+        self.pairs: List[Tuple[int, int]] = sorted(data)
+        self._index_pairs()
+        records = [data[zn] for zn in self.pairs]
+        self.columns: Dict[str, array] = {}
+        self.uncertainties: Dict[str, array] = {}
+        for field in fields:
+            objs = [props.get(field) for props in records]
+            self.columns[field] = array(VALUE_TYPECODE, map(_value_or_nan, objs))
+            self.uncertainties[field] = array(UNCERTAINTY_TYPECODE, map(_uncertainty_or_nan, objs))
+
+    # ==================== 二进制文件读写 ====================
+
+    def save(self, f: BinaryIO, stamp: Tuple[int, int, int]) -> None:
+        """
+        将列写入二进制文件，供 load 以内存映射方式读取
+
+        参数:
+            f: 以二进制写模式打开的文件
+            stamp: (数据版本, 数据文件修改时间 ns, 数据文件大小)，load 时用于判断是否过期；
+                   解析逻辑改变时数据版本随之递增，旧文件即失效
+        """
+        fields = tuple(self.columns)
+        header = pickle.dumps((fields, self.pairs), pickle.HIGHEST_PROTOCOL)
+        f.write(_pack_header(stamp, len(header)))
+        f.write(header)
+        offset = _HEADER.size + len(header)
+        for col in [*self.columns.values(), *self.uncertainties.values()]:
+            # 每列按 8 字节对齐，保证映射后可直接按元素类型访问
+            pad = -offset % 8
+            f.write(b'\0' * pad)
+            col.tofile(f)
+            offset += pad + len(col) * col.itemsize
+
+    @classmethod
+    def load(cls, path, stamp: Tuple[int, int, int],
+             fields: Sequence[str] = SCALAR_FIELDS) -> Optional['NuclideTable']:
+        """
+        以只读内存映射方式加载 save 写出的文件
+
+        各列为映射内存上的 memoryview，不复制数据，多个进程共享操作系统页缓存
+
+        参数:
+            path: 文件路径
+            stamp: 与 save 相同的 (数据版本, 修改时间 ns, 大小)
+            fields: 期望的字段
+
+        返回:
+            NuclideTable；文件不存在、已过期、损坏或字段不匹配时返回 None
+        """
+        try:
+            with open(path, 'rb') as f:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+
+        layout = _read_layout(mm, stamp, tuple(fields))
+        if layout is None:
+            mm.close()
+            return None
+        offset, pairs = layout
+
+        # 各列的位置已在 _read_layout 中校验过，以下切片不会越界
+        view = memoryview(mm)
+        n = len(pairs)
+
+        def next_column(typecode: str) -> memoryview:
+            nonlocal offset
+            offset += -offset % 8
+            size = n * array(typecode).itemsize
+            col = view[offset:offset + size].cast(typecode)
+            offset += size
+            return col
+
+        table = cls.__new__(cls)
+        table.pairs = pairs
+        table._index_pairs()
+        table.columns = {field: next_column(VALUE_TYPECODE) for field in fields}
+        table.uncertainties = {field: next_column(UNCERTAINTY_TYPECODE) for field in fields}
+        return table
+
+    def _index_pairs(self) -> None:
+        """由 pairs 建立行号索引与 Z/N 列"""
+        pairs = self.pairs
+        self.row_of: Dict[Tuple[int, int], int] = {zn: row for row, zn in enumerate(pairs)}
+        self.Z = array(INDEX_TYPECODE, [z for z, _ in pairs])
+        self.N = array(INDEX_TYPECODE, [n for _, n in pairs])
+
+    def __len__(self) -> int:
+        return len(self.pairs)
+
+    def isotope_rows(self, Z: int) -> range:
+        """
+        同位素链（质子数为 Z）的行号
+
+        pairs 按 (Z, N) 排序，同一 Z 的行连续，二分查找即可得到行号区间
+        """
+        pairs = self.pairs
+        return range(bisect_left(pairs, (Z,)), bisect_left(pairs, (Z + 1,)))
+
+    def isotone_rows(self, N: int) -> List[int]:
+        """同中子素链（中子数为 N）的行号，按 Z 升序"""
+        return [row for row, n in enumerate(self.N) if n == N]
+
+    def rows(self, nuclide_list: Iterable[Tuple[int, int]]) -> List[int]:
+        """
+        批量查找行号
+
+        返回:
+            与输入顺序一致的行号列表，未找到的核素被跳过
+        """
+        # 每个核素只查一次字典（map 在 C 层调用 get）
+        return [row for row in map(self.row_of.get, nuclide_list) if row is not None]
+
+    def column(self, field: str, rows: Optional[Iterable[int]] = None) -> List[float]:
+        """
+        读取一列数值
+
+        参数:
+            field: 字段名（须在 SCALAR_FIELDS 中）
+            rows: 行号序列（如 isotope_rows 返回的 range），为 None 时返回整列
+        """
+        return self._read(self.columns[field], rows)
+
+    def uncertainty(self, field: str, rows: Optional[Iterable[int]] = None) -> List[float]:
+        """
+        读取一列不确定度（参数同 column）
+        """
+        return self._read(self.uncertainties[field], rows)
+
+    def select(self, field: str, lo: Optional[float] = None, hi: Optional[float] = None) -> List[int]:
+        """
+        整列扫描，返回数值落在 [lo, hi] 内的行号
+
+        参数:
+            field: 字段名（须在 SCALAR_FIELDS 中）
+            lo, hi: 上下限（None 表示不限）；缺失值 (NaN) 总是被排除
+        """
+        lo = -inf if lo is None else lo
+        hi = inf if hi is None else hi
+        # NaN 与任何数比较均为 False，单次链式比较即可同时排除缺失值
+        return [row for row, v in enumerate(self.columns[field]) if lo <= v <= hi]
+
+    def stats(self, field: str, rows: Optional[Iterable[int]] = None) -> Optional[Tuple[int, float, float, float, int]]:
+        """
+        单次遍历统计一列数值（缺失值 NaN 被跳过）
+
+        参数:
+            field: 字段名（须在 SCALAR_FIELDS 中）
+            rows: 行号序列，为 None 时统计整列
+
+        返回:
+            (个数, 最小值, 最大值, 总和, 最大值所在行号)；没有有效数值时返回 None
+        """
+        rows = range(len(self)) if rows is None else list(rows)
+        values = self.column(field, rows)
+        # 筛掉 NaN 后交给内建 min/max/sum（C 实现）聚合
+        present = [v for v in values if v == v]
+        if not present:
+            return None
+        top = max(present)
+        return len(present), min(present), top, sum(present), rows[values.index(top)]
+
+    def get(self, Z: int, N: int, field: str) -> Optional[ValueWithUncertainty]:
+        """
+        从列中还原单个核素的带不确定度数值
+
+        返回:
+            ValueWithUncertainty（单位 MeV），核素或数值缺失时返回 None
+        """
+        row = self.row_of.get((Z, N))
+        if row is None:
+            return None
+        value = self.columns[field][row]
+        if value != value:
+            return None
+        unc = self.uncertainties[field][row]
+        return ValueWithUncertainty(value, unc if unc == unc else None, 'MeV')
+
+    @staticmethod
+    def _read(col, rows: Optional[Iterable[int]]) -> List[float]:
+        if rows is None:
+            return col.tolist()
+        if type(rows) is range and rows.step == 1:
+            # isotope_rows 给出的连续行号区间：整段切片转换，无需逐行索引
+            return col[rows.start:rows.stop].tolist()
+        return [col[row] for row in rows]
@@ -4,24 +4,52 @@
 使用 rich 库实现美观的命令行输出
 """
 
-from typing import Dict, List, Optional, Any
+from functools import lru_cache
+from typing import Dict, List, Optional
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
 from rich.text import Text
-from rich.tree import Tree
-from rich.columns import Columns
-from rich.layout import Layout
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.rule import Rule
-from rich.emoji import Emoji
-from rich.style import Style
 from rich.box import ROUNDED
 from rich.align import Align
-from rich.measure import Measurement
 
 from .nuclide_data import NuclideProperties
 from .config import QueryConfig
+
+# 上/下限不确定度的前缀
+_LIMIT_PREFIXES: Dict[str, str] = {'upper': '≤ ', 'lower': '≥ '}
+
+# 科学计数法格式说明符
+_SCI_SPEC = '10.3e'
+
+
+@lru_cache(maxsize=None)
+def _float_spec(int_len: int, max_len: int) -> str:
+    """
+    计算定宽浮点数的格式说明符（结果只取决于参数，生成一次后缓存）
+    
+    参数:
+        int_len: 整数部分位数
+        max_len: 总宽度
+    """
+    # 符号位长度
+    sign_len = 1
+
+    # 至少需要的位置: 整数部分 + 小数点 + 符号
+    min_required = int_len + 1 + sign_len  # +1 for the decimal point
+
+    if min_required > max_len:
+        # 无法满足最大长度要求，回退为科学计数法或截断显示
+        return f".{max_len - sign_len - 5}e"  # 如 "6.2e"
+
+    # 允许的小数位数
+    decimal_places = max_len - int_len - 1 - sign_len
+
+    return f"{max_len}.{decimal_places}f"
+
+
 class NuclideRichPrinter:
     """核素数据的美观输出类"""
     
@@ -60,29 +88,23 @@ class NuclideRichPrinter:
             'level': 'bold red',
         }
 
+    @property
+    def config(self) -> QueryConfig:
+        """查询配置"""
+        return self._config
+
+    @config.setter
+    def config(self, query_config: QueryConfig) -> None:
+        # 格式化时频繁使用的配置项在此读取一次
+        self._config = query_config
+        self._show_uncertainties = getattr(query_config, 'show_uncertainties', True) if query_config else True
+
     def format_float(self, value: Optional[float], max_len: int):
         """格式化整数或浮点数为指定长度，尽可能保持高精度"""
         if value is None:
             return ""
-        # 符号位长度
-        sign_len = 1
-
-        # 整数部分长度（包括可能为 0 的情况）
-        int_part = str(abs(int(value)))
-        int_len = len(int_part)
-
-        # 至少需要的位置: 整数部分 + 小数点 + 符号
-        min_required = int_len + 1 + sign_len  # +1 for the decimal point
-
-        if min_required > max_len:
-            # 无法满足最大长度要求，回退为科学计数法或截断显示
-            return f".{max_len - sign_len - 5}e"  # 如 "6.2e"
-
-        # 允许的小数位数
-        decimal_places = max_len - int_len - 1 - sign_len
-
-        return f"{max_len}.{decimal_places}f"
-        
+        # 格式说明符只取决于整数部分的位数，按位数缓存
+        return _float_spec(len(str(abs(int(value)))), max_len)
 
     def format_value(self, data, style="value", scientific=False):
         """格式化各种数值（包括不带/带不确定度，不带/带单位的数值，返回Rich Text对象"""
@@ -113,10 +135,7 @@ class NuclideRichPrinter:
             if abs(value) < 1e-3 or abs(value) > 1e8:
                 scientific = True
         
-        if scientific:
-            value_fmt = '10.3e'
-        else:
-            value_fmt = self.format_float(value, 10)
+        value_fmt = _SCI_SPEC if scientific else self.format_float(value, 10)
 
         # 构建Rich Text对象
         text = Text()
@@ -124,51 +143,64 @@ class NuclideRichPrinter:
         text.append(f"{value:{value_fmt}}", style=style)
         
         # 不确定度
-        if (getattr(self.config, 'show_uncertainties', True) if self.config else True) and uncertainty:
+        if uncertainty and self._show_uncertainties:
             if isinstance(uncertainty, dict):
-                # 处理复杂不确定度格式
-                if uncertainty.get('type') == 'symmetric':
-                    unc_val = uncertainty.get('value', 0)
-                    if scientific:
-                        unc_fmt = '10.3e'
-                    else:
-                        unc_fmt = self.format_float(unc_val, 10)
-                    if unc_val > 0:
-                        text.append(" ±", style=self.theme['uncertainty'])
-                        text.append(f"{unc_val:{unc_fmt}}", style=self.theme['uncertainty'])
-                elif uncertainty.get('type') == 'asymmetric':
-                    upper = uncertainty.get('upperLimit', 0)
-                    lower = uncertainty.get('lowerLimit', 0)
-                    if scientific:
-                        upper_fmt = '10.3e'
-                        lower_fmt = '10.3e'
-                    else:
-                        upper_fmt = self.format_float(upper, 10)
-                        lower_fmt = self.format_float(lower, 10)
-                    if upper > 0 or lower > 0:
-                        text.append(" +", style=self.theme['uncertainty'])
-                        text.append(f"{upper:{upper_fmt}}", style=self.theme['uncertainty'])
-                        text.append("/-", style=self.theme['uncertainty'])
-                        text.append(f"{lower:{lower_fmt}}", style=self.theme['uncertainty'])
-                elif uncertainty.get('type') == 'approximation':
-                    text = Text.assemble(Text("~ ", style=self.theme['uncertainty']), text)
-                elif uncertainty.get('type') == 'limit':
-                    if uncertainty.get('limitType') == 'upper':
-                        text = Text.assemble(Text("≤ ", style=self.theme['uncertainty']), text)
-                    elif uncertainty.get('limitType') == 'lower':
-                        text = Text.assemble(Text("≥ ", style=self.theme['uncertainty']), text)
+                # 处理复杂不确定度格式：按类型分派
+                handler = self._UNCERTAINTY_FORMATTERS.get(uncertainty.get('type'))
+                if handler is not None:
+                    text = handler(self, text, uncertainty, scientific)
 
             elif isinstance(uncertainty, (int, float)) and uncertainty > 0:
-                if scientific:
-                    uncertainty_fmt = '10.3e'
-                else:
-                    uncertainty_fmt = self.format_float(uncertainty, 10)
                 text.append(" ±", style=self.theme['uncertainty'])
-                text.append(f"{uncertainty:{uncertainty_fmt}}", style=self.theme['uncertainty'])
+                text.append(f"{uncertainty:{self._unc_fmt(uncertainty, scientific)}}", style=self.theme['uncertainty'])
         text.append(f" {unit}", style=self.theme['unit'])
         
         return text
 
+    # ==================== 复杂不确定度格式 ====================
+
+    def _unc_fmt(self, value, scientific: bool) -> str:
+        """不确定度数值的格式说明符"""
+        return _SCI_SPEC if scientific else self.format_float(value, 10)
+
+    def _format_symmetric(self, text: Text, uncertainty: dict, scientific: bool) -> Text:
+        """对称不确定度: 值 ±δ"""
+        unc_val = uncertainty.get('value', 0)
+        if unc_val > 0:
+            text.append(" ±", style=self.theme['uncertainty'])
+            text.append(f"{unc_val:{self._unc_fmt(unc_val, scientific)}}", style=self.theme['uncertainty'])
+        return text
+
+    def _format_asymmetric(self, text: Text, uncertainty: dict, scientific: bool) -> Text:
+        """非对称不确定度: 值 +上限/-下限"""
+        upper = uncertainty.get('upperLimit', 0)
+        lower = uncertainty.get('lowerLimit', 0)
+        if upper > 0 or lower > 0:
+            text.append(" +", style=self.theme['uncertainty'])
+            text.append(f"{upper:{self._unc_fmt(upper, scientific)}}", style=self.theme['uncertainty'])
+            text.append("/-", style=self.theme['uncertainty'])
+            text.append(f"{lower:{self._unc_fmt(lower, scientific)}}", style=self.theme['uncertainty'])
+        return text
+
+    def _format_approximation(self, text: Text, uncertainty: dict, scientific: bool) -> Text:
+        """近似值: ~ 值"""
+        return Text.assemble(Text("~ ", style=self.theme['uncertainty']), text)
+
+    def _format_limit(self, text: Text, uncertainty: dict, scientific: bool) -> Text:
+        """上/下限: ≤ 值 或 ≥ 值"""
+        prefix = _LIMIT_PREFIXES.get(uncertainty.get('limitType'))
+        if prefix is None:
+            return text
+        return Text.assemble(Text(prefix, style=self.theme['uncertainty']), text)
+
+    # 不确定度类型 -> 格式化方法
+    _UNCERTAINTY_FORMATTERS = {
+        'symmetric': _format_symmetric,
+        'asymmetric': _format_asymmetric,
+        'approximation': _format_approximation,
+        'limit': _format_limit,
+    }
+
     def _create_standard_table(self, title: str, show_header: bool = False, style: Optional[str] = None, columns: Optional[List[tuple]] = None) -> Table:
         """创建标准格式的表格
         
@@ -200,6 +232,19 @@ class NuclideRichPrinter:
 
         return table
     
+    def _add_row(self, table: Table, nuclide_data: NuclideProperties, key: str, data_key: str) -> None:
+        """向表格添加一行数据
+        
+        参数:
+            table: 要添加行的表格对象
+            nuclide_data: 核素数据
+            key: 列名
+            data_key: 数据键，用于获取数据
+        """
+        data = nuclide_data.get(data_key)
+        if data:
+            table.add_row(Text(key), self.format_value(data))
+    
     def print_nuclide_info(self, nuclide_data: NuclideProperties) -> None:
         """打印核素的详细信息"""
         if not nuclide_data:
@@ -214,23 +259,14 @@ class NuclideRichPrinter:
         Z, N, A = nuclide_data.get('Z', 0), nuclide_data.get('N', 0), nuclide_data.get('A', 0)
         symbol = nuclide_data.get('symbol', 'Unknown')
         
-        def add_row_to_table(self, table: Table, key: str, data_key: str) -> None:
-            """向表格添加一行数据
-            
-            参数:
-                table: 要添加行的表格对象
-                key: 列名
-                data_key: 数据键，用于获取数据
-            """
-            data = nuclide_data.get(data_key)
-            if data:
-                table.add_row(Text(key), self.format_value(data))
+        config = self.config
+        add_row = self._add_row
         
-        if not self.config.show_minimal_info:
+        if not config.show_minimal_info:
             self.console.print(Align.center(f"{A}{symbol} (Z={Z}, N={N})"))
 
         # 最小信息
-        if self.config.show_minimal_info:
+        if config.show_minimal_info:
             columns = [
             ("核素", int(self.table_width * 0.2), self.theme['element']),
             ("结合能", int(self.table_width * 0.25), self.theme['energy']),
@@ -257,7 +293,7 @@ class NuclideRichPrinter:
                 decay_mode_texts.append(
                     Text(f"{mode.mode}", style=self.theme['level'])
                 )
-            decay_mode_text = Text.assemble(*[item for text in decay_mode_texts for item in (text, Text("/"))])[:-1]
+            decay_mode_text = Text("/").join(decay_mode_texts)
             
             ground_state = nuclide_data.get('ground_state')
             halflife = ground_state.halflife if ground_state and hasattr(ground_state, 'halflife') else None
@@ -273,114 +309,114 @@ class NuclideRichPrinter:
             
         
         # 能量特性
-        if self.config.show_energy_info:
+        if config.show_energy_info:
             title = f"{A}{symbol} 能量特性"
             energy_table = self._create_standard_table(title, style=self.theme['energy'])
 
-            if self.config.show_binding_energy:
-                add_row_to_table(self, energy_table, "结合能", 'bindingEnergy')
-            if self.config.show_binding_energy_per_nucleon:
-                add_row_to_table(self, energy_table, "比结合能", 'bindingEnergyPerNucleon')
+            if config.show_binding_energy:
+                add_row(energy_table, nuclide_data, "结合能", 'bindingEnergy')
+            if config.show_binding_energy_per_nucleon:
+                add_row(energy_table, nuclide_data, "比结合能", 'bindingEnergyPerNucleon')
 
             self.console.print(Align.center(energy_table))
         
         # 分离能
-        if self.config.show_separation_info:
+        if config.show_separation_info:
             
             separation_table = self._create_standard_table(
                 title=f"{A}{symbol} 分离能",
                 style=self.theme['separation']
             )
 
-            if self.config.show_neutron_separation:
-                add_row_to_table(self, separation_table, "中子分离能", 'neutronSeparationEnergy')
-            if self.config.show_proton_separation:
-                add_row_to_table(self, separation_table, "质子分离能", 'protonSeparationEnergy')
-            if self.config.show_two_neutron_separation:
-                add_row_to_table(self, separation_table, "双中子分离能", 'twoNeutronSeparationEnergy')
-            if self.config.show_two_proton_separation:
-                add_row_to_table(self, separation_table, "双质子分离能", 'twoProtonSeparationEnergy')
+            if config.show_neutron_separation:
+                add_row(separation_table, nuclide_data, "中子分离能", 'neutronSeparationEnergy')
+            if config.show_proton_separation:
+                add_row(separation_table, nuclide_data, "质子分离能", 'protonSeparationEnergy')
+            if config.show_two_neutron_separation:
+                add_row(separation_table, nuclide_data, "双中子分离能", 'twoNeutronSeparationEnergy')
+            if config.show_two_proton_separation:
+                add_row(separation_table, nuclide_data, "双质子分离能", 'twoProtonSeparationEnergy')
             
             self.console.print(Align.center(separation_table))
         
         # Q值特性
-        if self.config.show_Q_values:
+        if config.show_Q_values:
             Q_value_table = self._create_standard_table(
                 title=f"{A}{symbol} Q值",
                 style=self.theme['Q_value']
             )
-            if self.config.show_alpha_separation:
-                add_row_to_table(self, Q_value_table, "α衰变Q值", 'alphaSeparationEnergy')
-            if self.config.show_delta_alpha:
-                add_row_to_table(self, Q_value_table, "α衰变Q值变化量", 'deltaAlpha')
-            if self.config.show_beta_minus:
-                add_row_to_table(self, Q_value_table, "β-衰变Q值", 'betaMinus')
-            if self.config.show_electron_capture:
-                add_row_to_table(self, Q_value_table, "电子捕获Q值", 'electronCapture')
-            if self.config.show_positron_emission:
-                add_row_to_table(self, Q_value_table, "正电子发射Q值", 'positronEmission')
-            if self.config.show_beta_minus_one_neutron_emission:
-                add_row_to_table(self, Q_value_table, "β-单中子发射Q值", 'betaMinusOneNeutronEmission')
-            if self.config.show_beta_minus_two_neutron_emission:
-                add_row_to_table(self, Q_value_table, "β-双中子发射Q值", 'betaMinusTwoNeutronEmission')
-            if self.config.show_electron_capture_one_proton_emission:
-                add_row_to_table(self, Q_value_table, "电子捕获单质子发射Q值", 'electronCaptureOneProtonEmission')
-            if self.config.show_double_beta_minus:
-                add_row_to_table(self, Q_value_table, "双β-衰变Q值", 'doubleBetaMinus')
-            if self.config.show_double_electron_capture:
-                add_row_to_table(self, Q_value_table, "双电子捕获Q值", 'doubleElectronCapture')
+            if config.show_alpha_separation:
+                add_row(Q_value_table, nuclide_data, "α衰变Q值", 'alphaSeparationEnergy')
+            if config.show_delta_alpha:
+                add_row(Q_value_table, nuclide_data, "α衰变Q值变化量", 'deltaAlpha')
+            if config.show_beta_minus:
+                add_row(Q_value_table, nuclide_data, "β-衰变Q值", 'betaMinus')
+            if config.show_electron_capture:
+                add_row(Q_value_table, nuclide_data, "电子捕获Q值", 'electronCapture')
+            if config.show_positron_emission:
+                add_row(Q_value_table, nuclide_data, "正电子发射Q值", 'positronEmission')
+            if config.show_beta_minus_one_neutron_emission:
+                add_row(Q_value_table, nuclide_data, "β-单中子发射Q值", 'betaMinusOneNeutronEmission')
+            if config.show_beta_minus_two_neutron_emission:
+                add_row(Q_value_table, nuclide_data, "β-双中子发射Q值", 'betaMinusTwoNeutronEmission')
+            if config.show_electron_capture_one_proton_emission:
+                add_row(Q_value_table, nuclide_data, "电子捕获单质子发射Q值", 'electronCaptureOneProtonEmission')
+            if config.show_double_beta_minus:
+                add_row(Q_value_table, nuclide_data, "双β-衰变Q值", 'doubleBetaMinus')
+            if config.show_double_electron_capture:
+                add_row(Q_value_table, nuclide_data, "双电子捕获Q值", 'doubleElectronCapture')
             
             self.console.print(Align.center(Q_value_table))
         
 
         # 激发态能量
-        if self.config.show_excitation_energy:
+        if config.show_excitation_energy:
             excitation_table = self._create_standard_table(
                 title=f"{A}{symbol} 激发态能量",
                 style=self.theme['excitation']
             )
-            if self.config.show_first_excitation_energy:
-                add_row_to_table(self, excitation_table, "第一激发能", 'firstExcitedEnergy')
-            if self.config.show_first_2plus_energy:
-                add_row_to_table(self, excitation_table, "第一2+态", 'firstTwoPlusEnergy')
-            if self.config.show_first_4plus_energy:
-                add_row_to_table(self, excitation_table, "第一4+态", 'firstFourPlusEnergy')
-            if self.config.show_first_4plus_divided_by_2plus:
-                add_row_to_table(self, excitation_table, "第一4+态/第一2+态", 'firstFourPlusOverFirstTwoPlusEnergy')
-            if self.config.show_first_3minus_energy:
-                add_row_to_table(self, excitation_table, "第一3-态", 'firstThreeMinusEnergy')
+            if config.show_first_excitation_energy:
+                add_row(excitation_table, nuclide_data, "第一激发能", 'firstExcitedEnergy')
+            if config.show_first_2plus_energy:
+                add_row(excitation_table, nuclide_data, "第一2+态", 'firstTwoPlusEnergy')
+            if config.show_first_4plus_energy:
+                add_row(excitation_table, nuclide_data, "第一4+态", 'firstFourPlusEnergy')
+            if config.show_first_4plus_divided_by_2plus:
+                add_row(excitation_table, nuclide_data, "第一4+态/第一2+态", 'firstFourPlusOverFirstTwoPlusEnergy')
+            if config.show_first_3minus_energy:
+                add_row(excitation_table, nuclide_data, "第一3-态", 'firstThreeMinusEnergy')
 
             # 显示表格（居中）
             self.console.print(Align.center(excitation_table))
     
         # 裂变产额
-        if self.config.show_fission_yields:
+        if config.show_fission_yields:
             fission_yield_table = self._create_standard_table(
                 title=f"{A}{symbol} 裂变产额",
                 style=self.theme['fission_yield']
             )
-            if self.config.show_u235_ify:
-                add_row_to_table(self, fission_yield_table, "U235独立产额", 'FY235U')
-            if self.config.show_u238_ify:
-                add_row_to_table(self, fission_yield_table, "U238独立产额", 'FY238U')
-            if self.config.show_pu239_ify:
-                add_row_to_table(self, fission_yield_table, "Pu239独立产额", 'FY239Pu')
-            if self.config.show_cf252_ify:
-                add_row_to_table(self, fission_yield_table, "Cf252独立产额", 'FY252Cf')
-            if self.config.show_u235_cfy:
-                add_row_to_table(self, fission_yield_table, "U235累积产额", 'cFY235U')
-            if self.config.show_u238_cfy:
-                add_row_to_table(self, fission_yield_table, "U238累积产额", 'cFY238U')
-            if self.config.show_pu239_cfy:
-                add_row_to_table(self, fission_yield_table, "Pu239累积产额", 'cFY239Pu')
-            if self.config.show_cf252_cfy:
-                add_row_to_table(self, fission_yield_table, "Cf252累积产额", 'cFY252Cf')
+            if config.show_u235_ify:
+                add_row(fission_yield_table, nuclide_data, "U235独立产额", 'FY235U')
+            if config.show_u238_ify:
+                add_row(fission_yield_table, nuclide_data, "U238独立产额", 'FY238U')
+            if config.show_pu239_ify:
+                add_row(fission_yield_table, nuclide_data, "Pu239独立产额", 'FY239Pu')
+            if config.show_cf252_ify:
+                add_row(fission_yield_table, nuclide_data, "Cf252独立产额", 'FY252Cf')
+            if config.show_u235_cfy:
+                add_row(fission_yield_table, nuclide_data, "U235累积产额", 'cFY235U')
+            if config.show_u238_cfy:
+                add_row(fission_yield_table, nuclide_data, "U238累积产额", 'cFY238U')
+            if config.show_pu239_cfy:
+                add_row(fission_yield_table, nuclide_data, "Pu239累积产额", 'cFY239Pu')
+            if config.show_cf252_cfy:
+                add_row(fission_yield_table, nuclide_data, "Cf252累积产额", 'cFY252Cf')
             
             # 显示表格（居中）
             self.console.print(Align.center(fission_yield_table))
         
         # 能级信息 - 单独显示
-        if self.config.show_levels:
+        if config.show_levels:
             energy_levels = nuclide_data.get('levels')
             if energy_levels:                
                 # 定义能级表格的列
@@ -410,8 +446,8 @@ class NuclideRichPrinter:
                             branch_ratio_texts.append(self.format_value(mode))
                         
                         # 连接Text对象
-                        decay_mode_text = Text.assemble(*[item for text in decay_mode_texts for item in (text, Text("\n"))])[:-1]
-                        branch_ratio_text = Text.assemble(*[item for text in branch_ratio_texts for item in (text, Text("\n"))])[:-1]
+                        decay_mode_text = Text("\n").join(decay_mode_texts)
+                        branch_ratio_text = Text("\n").join(branch_ratio_texts)
                     else:
                         decay_mode_text = Text("未知", style="dim")
                         branch_ratio_text = Text("未知", style="dim")
@@ -472,7 +508,6 @@ class NuclideRichPrinter:
             be_str = "未知"
             be_data = nuclide.get('bindingEnergy')
             if be_data:
-                energy_unit = getattr(self.config, 'energy_unit', 'MeV') if self.config else 'MeV'
                 formatted_be = self.format_value(be_data, "energy")
                 if formatted_be:
                     be_str = formatted_be.plain
@@ -7,6 +7,9 @@ setup(
     install_requires=[
         "rich",
     ],
+    extras_require={
+        "fast": ["msgspec"],  # 可选：加速 JSON 数据解析（结果与标准库 json 一致）
+    },
     package_data={
         'nucquery': ['data/*.json', 'data/*.dat'],
     },
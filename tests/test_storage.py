@@ -0,0 +1,143 @@
+"""
+磁盘缓存、列式存储与导出的回归测试
+
+运行: python -m unittest discover -s tests（或 python -m pytest tests）
+缓存写入临时目录（NUCQUERY_CACHE_DIR），不影响用户的缓存
+"""
+
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from nucquery import data_source
+from nucquery.data_source import ExperimentalDataSource
+from nucquery.nuclide_query import NuclideQuery
+from nucquery.nuclide_table import SCALAR_FIELDS, NuclideTable
+
+
+class CacheDirTestCase(unittest.TestCase):
+    """每个测试使用独立的临时缓存目录，并清空进程内解析缓存"""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp_dir = Path(self._tmp.name)
+        env = mock.patch.dict(os.environ, {'NUCQUERY_CACHE_DIR': str(self.tmp_dir / 'cache')})
+        env.start()
+        self.addCleanup(env.stop)
+        self.addCleanup(self._tmp.cleanup)
+        data_source._PARSED_CACHE.clear()
+        self.addCleanup(data_source._PARSED_CACHE.clear)
+
+
+class TableFileTest(CacheDirTestCase):
+    """NuclideTable.save / load"""
+
+    STAMP = (data_source._DISK_CACHE_VERSION, 123456789, 4096)
+
+    @classmethod
+    def setUpClass(cls):
+        with tempfile.TemporaryDirectory() as cache_dir, \
+                mock.patch.dict(os.environ, {'NUCQUERY_CACHE_DIR': cache_dir}):
+            source = ExperimentalDataSource(fields=frozenset(SCALAR_FIELDS))
+            cls.table = NuclideTable({zn: source.get_nuclide(*zn) for zn in source.list_nuclides()})
+        data_source._PARSED_CACHE.clear()
+
+    def _save(self) -> Path:
+        path = self.tmp_dir / 'table.bin'
+        with open(path, 'wb') as f:
+            self.table.save(f, self.STAMP)
+        return path
+
+    def test_round_trip(self):
+        loaded = NuclideTable.load(self._save(), self.STAMP)
+        self.assertIsNotNone(loaded)
+        self.assertEqual(loaded.pairs, self.table.pairs)
+        self.assertEqual(list(loaded.Z), list(self.table.Z))
+        self.assertEqual(list(loaded.N), list(self.table.N))
+        # 按字节比较，缺失值 (NaN) 也必须原样读回
+        for field in SCALAR_FIELDS:
+            self.assertEqual(loaded.columns[field].tobytes(), self.table.columns[field].tobytes(), field)
+            self.assertEqual(loaded.uncertainties[field].tobytes(),
+                             self.table.uncertainties[field].tobytes(), field)
+
+    def test_stale_stamp(self):
+        path = self._save()
+        version, mtime_ns, size = self.STAMP
+        self.assertIsNone(NuclideTable.load(path, (version + 1, mtime_ns, size)))
+        self.assertIsNone(NuclideTable.load(path, (version, mtime_ns + 1, size)))
+        self.assertIsNone(NuclideTable.load(path, (version, mtime_ns, size + 1)))
+
+    def test_truncated_file(self):
+        path = self._save()
+        full_size = path.stat().st_size
+        for size in (full_size - 8, 40, 0):
+            with open(path, 'r+b') as f:
+                f.truncate(size)
+            self.assertIsNone(NuclideTable.load(path, self.STAMP), size)
+
+    def test_field_mismatch(self):
+        self.assertIsNone(NuclideTable.load(self._save(), self.STAMP, SCALAR_FIELDS[:-1]))
+
+
+class ParseCacheTest(CacheDirTestCase):
+    """解析结果缓存 (.cache.pkl)"""
+
+    def setUp(self):
+        super().setUp()
+        # 从包内数据中截取几个条目，解析足够快
+        with open(ExperimentalDataSource().data_file, encoding='utf-8') as f:
+            entries = json.load(f)
+        names = list(entries)[:20]
+        self.data_file = self.tmp_dir / 'subset.json'
+        with open(self.data_file, 'w', encoding='utf-8') as f:
+            json.dump({name: entries[name] for name in names}, f)
+
+    def _load(self):
+        data_source._PARSED_CACHE.clear()
+        source = ExperimentalDataSource(self.data_file)
+        with mock.patch.object(data_source, '_iter_json_items',
+                               wraps=data_source._iter_json_items) as parse:
+            pairs = source.list_nuclides()
+        return pairs, parse.call_count
+
+    def test_reuses_cache(self):
+        pairs, parsed = self._load()
+        self.assertEqual(parsed, 1)
+        self.assertEqual(self._load(), (pairs, 0))
+
+    def test_version_mismatch_reparses(self):
+        pairs, _ = self._load()
+        with mock.patch.object(data_source, '_DISK_CACHE_VERSION', data_source._DISK_CACHE_VERSION + 1):
+            self.assertIsNone(data_source._read_disk_cache(self.data_file))
+            self.assertEqual(self._load(), (pairs, 1))
+            # 重新解析后按新版本写回缓存
+            self.assertEqual(self._load(), (pairs, 0))
+
+
+class QueryTest(CacheDirTestCase):
+    """基于包内实验数据的查询"""
+
+    def setUp(self):
+        super().setUp()
+        self.query = NuclideQuery()
+
+    def test_export_csv_matches_save_to_csv(self):
+        pairs = [(26, N) for N in range(15, 50)] + [(92, 146), (0, 1), (200, 1)]
+        by_objects = self.tmp_dir / 'save_to_csv.csv'
+        by_columns = self.tmp_dir / 'export_csv.csv'
+        count = self.query.save_to_csv(self.query.query_from_list(pairs), str(by_objects))
+        self.assertEqual(self.query.export_csv(pairs, str(by_columns)), count)
+        self.assertEqual(by_columns.read_bytes(), by_objects.read_bytes())
+
+    def test_decay_path_u238(self):
+        path = self.query.get_decay_path(92, 146)
+        self.assertEqual(path[0].name, 'U-238')
+        self.assertEqual(path[-1].name, 'Pb-206')
+        self.assertTrue(path[-1].is_stable)
+
+
+if __name__ == '__main__':
+    unittest.main()